@@ -1,6 +1,8 @@
 import asyncpg
-from typing import Optional
+from typing import AsyncIterator, Optional
 import logging
+import warnings
+from contextlib import asynccontextmanager
 
 from app.config.settings import settings
 
@@ -16,7 +18,12 @@ class DatabaseConfig:
         self._initialized = False
     
     async def connect(self):
-        """Create database connection pool."""
+        """
+        Create database connection pool.
+        
+        asyncpg opens ``min_size`` connections while creating the pool, so the
+        pool is already warm once this returns.
+        """
         if self._initialized:
             logger.warning("Database pool already initialized")
             return
@@ -30,10 +37,17 @@ class DatabaseConfig:
                 database=settings.POSTGRES_DB,
                 min_size=settings.POSTGRES_MIN_POOL_SIZE,
                 max_size=settings.POSTGRES_MAX_POOL_SIZE,
+                max_queries=settings.POSTGRES_MAX_QUERIES,
+                max_inactive_connection_lifetime=settings.POSTGRES_MAX_INACTIVE_LIFETIME,
+                statement_cache_size=settings.POSTGRES_STATEMENT_CACHE_SIZE,
+                max_cached_statement_lifetime=settings.POSTGRES_MAX_CACHED_STATEMENT_LIFETIME,
                 command_timeout=60,
             )
             self._initialized = True
-            logger.info("Database connection pool created successfully")
+            logger.info(
+                f"Database connection pool created successfully "
+                f"({self.pool.get_size()} connections open)"
+            )
         except Exception as e:
             logger.error(f"Failed to create database pool: {e}")
             raise
@@ -45,21 +59,45 @@ class DatabaseConfig:
             self._initialized = False
             logger.info("Database connection pool closed")
     
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Acquire a connection that is always released back to the pool.
+        
+        Usage:
+            async with db_config.acquire() as conn:
+                await conn.fetch("SELECT ...")
+        """
+        if not self.pool:
+            raise RuntimeError("Database pool not initialized")
+        async with self.pool.acquire() as conn:
+            yield conn
+    
     async def get_connection(self) -> asyncpg.Connection:
-        """Get a connection from the pool."""
+        """Get a connection from the pool. Deprecated: use acquire()."""
+        warnings.warn(
+            "get_connection() is deprecated, use 'async with db_config.acquire()'",
+            DeprecationWarning,
+            stacklevel=2
+        )
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
         return await self.pool.acquire()
     
     async def release_connection(self, connection: asyncpg.Connection):
-        """Release a connection back to the pool."""
+        """Release a connection back to the pool. Deprecated: use acquire()."""
+        warnings.warn(
+            "release_connection() is deprecated, use 'async with db_config.acquire()'",
+            DeprecationWarning,
+            stacklevel=2
+        )
         if self.pool:
             await self.pool.release(connection)
     
     async def health_check(self) -> bool:
         """Check if database is healthy."""
         try:
-            async with self.pool.acquire() as conn:
+            async with self.acquire() as conn:
                 await conn.fetchval("SELECT 1")
             return True
         except Exception as e:
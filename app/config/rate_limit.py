@@ -0,0 +1,11 @@
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.config.settings import settings
+
+# Shared by the app and every router; when disabled, the route decorators
+# pass requests straight through
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
@@ -22,12 +22,25 @@ class RedisConfig:
             return
         
         try:
-            self.redis = await aioredis.from_url(
-                settings.redis_url,
-                max_connections=settings.REDIS_MAX_CONNECTIONS,
-                decode_responses=settings.REDIS_DECODE_RESPONSES,
-                encoding="utf-8",
-            )
+            if settings.REDIS_SINGLE_CONNECTION_CLIENT:
+                # One multiplexed socket for low-concurrency workers
+                self.redis = await aioredis.from_url(
+                    settings.redis_url,
+                    single_connection_client=True,
+                    decode_responses=settings.REDIS_DECODE_RESPONSES,
+                    encoding="utf-8",
+                )
+            else:
+                # Blocking pool waits for a free connection instead of
+                # serializing acquisitions behind the pool lock
+                pool = aioredis.BlockingConnectionPool.from_url(
+                    settings.redis_url,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                    timeout=settings.REDIS_POOL_TIMEOUT,
+                    decode_responses=settings.REDIS_DECODE_RESPONSES,
+                    encoding="utf-8",
+                )
+                self.redis = await aioredis.Redis.from_pool(pool)
             self._initialized = True
             logger.info("Redis connection created successfully")
         except Exception as e:
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = 1  # each worker opens its own DB and Redis pools
     
     # OpenAI
     OPENAI_API_KEY: str
@@ -38,8 +39,12 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str = "ai_backend"
-    POSTGRES_MIN_POOL_SIZE: int = 5
+    POSTGRES_MIN_POOL_SIZE: int = 10
     POSTGRES_MAX_POOL_SIZE: int = 20
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 1024  # prepared statements cached per connection
+    POSTGRES_MAX_CACHED_STATEMENT_LIFETIME: int = 0  # seconds; 0 keeps statements until LRU eviction
+    POSTGRES_MAX_INACTIVE_LIFETIME: float = 300.0  # seconds before idle connections close
+    POSTGRES_MAX_QUERIES: int = 50000  # queries before a connection is recycled
     
     # Redis
     REDIS_HOST: str = "localhost"
@@ -47,7 +52,9 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 0
     REDIS_MAX_CONNECTIONS: int = 10
-    REDIS_DECODE_RESPONSES: bool = True
+    REDIS_DECODE_RESPONSES: bool = False
+    REDIS_POOL_TIMEOUT: int = 5  # seconds to wait for a free pooled connection
+    REDIS_SINGLE_CONNECTION_CLIENT: bool = False
     
     # MongoDB
     MONGODB_HOST: str = "localhost"
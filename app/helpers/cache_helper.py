@@ -1,14 +1,51 @@
-import json
 import logging
-from typing import Any, Optional, Union
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Union
 from functools import wraps
-import hashlib
+
+import orjson
+import xxhash
 
 from app.config.redis_config import redis_config
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Keys requested per SCAN call when deleting by pattern
+_SCAN_BATCH_SIZE = 500
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only row views (any Mapping) that orjson doesn't know."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for storage in Redis."""
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+# Count a hit and start the window expiry on the first one, atomically
+_RATE_LIMIT_INCR_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+
+# Take the lock only if it is free and write the value, in one atomic
+# round-trip. The lock is left to expire, so it also blocks further writes
+# to the key until lock_timeout has passed.
+_SET_WITH_LOCK_SCRIPT = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    redis.call('SETEX', KEYS[2], ARGV[3], ARGV[4])
+    return 1
+end
+return 0
+"""
+
 
 class CacheHelper:
     """Helper class for Redis caching operations."""
@@ -18,6 +55,9 @@ class CacheHelper:
         self.redis = redis_config
         self.default_ttl = settings.CACHE_TTL
         self.enabled = settings.CACHE_ENABLED
+        self._scripts: Dict[str, Any] = {}
+        # Bound at startup so hot paths skip the get_client() call
+        self._client = None
     
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -33,11 +73,11 @@ class CacheHelper:
             return None
         
         try:
-            client = self.redis.get_client()
+            client = self._client or self.redis.get_client()
             value = await client.get(key)
             if value:
                 logger.debug(f"Cache hit: {key}")
-                return json.loads(value) if value else None
+                return orjson.loads(value)
             logger.debug(f"Cache miss: {key}")
             return None
         except Exception as e:
@@ -65,9 +105,9 @@ class CacheHelper:
             return False
         
         try:
-            client = self.redis.get_client()
+            client = self._client or self.redis.get_client()
             ttl = ttl or self.default_ttl
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             await client.setex(key, ttl, serialized)
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
@@ -75,6 +115,59 @@ class CacheHelper:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get multiple values from cache in a single round-trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached values (None for misses) in the same order as keys
+        """
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+        
+        try:
+            client = self._client or self.redis.get_client()
+            values = await client.mget(keys)
+            logger.debug(f"Cache get many: {len(keys)} keys")
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache get many error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
+    async def set_many(
+        self, 
+        mapping: Dict[str, Any], 
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set multiple values in cache using one pipelined round-trip.
+        
+        Args:
+            mapping: Cache key to value mapping
+            ttl: Time to live in seconds (default from settings)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled or not mapping:
+            return False
+        
+        try:
+            client = self._client or self.redis.get_client()
+            ttl = ttl or self.default_ttl
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, ttl, _dumps(value))
+                await pipe.execute()
+            logger.debug(f"Cache set many: {len(mapping)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set many error for {len(mapping)} keys: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """
         Delete a value from cache.
@@ -89,7 +182,7 @@ class CacheHelper:
             return False
         
         try:
-            client = self.redis.get_client()
+            client = self._client or self.redis.get_client()
             await client.delete(key)
             logger.debug(f"Cache delete: {key}")
             return True
@@ -111,16 +204,24 @@ class CacheHelper:
             return 0
         
         try:
-            client = self.redis.get_client()
-            keys = []
-            async for key in client.scan_iter(match=pattern):
-                keys.append(key)
+            client = self._client or self.redis.get_client()
+            deleted = 0
+            cursor = 0
+            # Unlink each SCAN batch as it arrives; UNLINK frees memory in a
+            # background thread on the server instead of blocking it
+            while True:
+                cursor, keys = await client.scan(
+                    cursor=cursor,
+                    match=pattern,
+                    count=_SCAN_BATCH_SIZE
+                )
+                if keys:
+                    deleted += await client.unlink(*keys)
+                if cursor == 0:
+                    break
             
-            if keys:
-                deleted = await client.delete(*keys)
-                logger.debug(f"Cache delete pattern {pattern}: {deleted} keys")
-                return deleted
-            return 0
+            logger.debug(f"Cache delete pattern {pattern}: {deleted} keys")
+            return deleted
         except Exception as e:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
             return 0
@@ -139,7 +240,7 @@ class CacheHelper:
             return False
         
         try:
-            client = self.redis.get_client()
+            client = self._client or self.redis.get_client()
             exists = await client.exists(key)
             return bool(exists)
         except Exception as e:
@@ -161,13 +262,38 @@ class CacheHelper:
             return None
         
         try:
-            client = self.redis.get_client()
+            client = self._client or self.redis.get_client()
             value = await client.incrby(key, amount)
             return value
         except Exception as e:
             logger.error(f"Cache increment error for key {key}: {e}")
             return None
     
+    async def rate_limit_incr(self, key: str, window: int) -> Optional[int]:
+        """
+        Increment a rate limit counter that expires after a time window.
+        
+        The counter gets its expiry on the first hit of each window, and both
+        steps run in one atomic script call.
+        
+        Args:
+            key: Rate limit key (e.g., "rate:<client>:<route>")
+            window: Window length in seconds
+            
+        Returns:
+            Number of hits in the current window or None
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            client = self._client or self.redis.get_client()
+            script = self._get_script(client, _RATE_LIMIT_INCR_SCRIPT)
+            return await script(keys=[key], args=[window], client=client)
+        except Exception as e:
+            logger.error(f"Rate limit increment error for key {key}: {e}")
+            return None
+    
     async def set_with_lock(
         self, 
         key: str, 
@@ -178,6 +304,10 @@ class CacheHelper:
         """
         Set a value with distributed lock.
         
+        The lock is not released after the write; it expires after
+        lock_timeout, and until then other set_with_lock calls for the
+        same key are refused.
+        
         Args:
             key: Cache key
             value: Value to cache
@@ -185,43 +315,44 @@ class CacheHelper:
             ttl: Time to live in seconds
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False if the lock is held or on error
         """
         if not self.enabled:
             return False
         
         lock_key = f"lock:{key}"
-        client = self.redis.get_client()
         
         try:
-            # Acquire lock
-            lock_acquired = await client.set(
-                lock_key, 
-                "1", 
-                nx=True, 
-                ex=lock_timeout
+            client = self._client or self.redis.get_client()
+            ttl = ttl or self.default_ttl
+            serialized = _dumps(value)
+            
+            # Acquire lock and set value in one atomic call
+            script = self._get_script(client, _SET_WITH_LOCK_SCRIPT)
+            result = await script(
+                keys=[lock_key, key],
+                args=["1", lock_timeout, ttl, serialized],
+                client=client
             )
             
-            if not lock_acquired:
+            if not result:
                 logger.warning(f"Could not acquire lock for key {key}")
                 return False
             
-            # Set value
-            result = await self.set(key, value, ttl)
-            
-            # Release lock
-            await client.delete(lock_key)
-            
-            return result
+            logger.debug(f"Cache set with lock: {key} (TTL: {ttl}s)")
+            return True
         except Exception as e:
             logger.error(f"Cache set with lock error for key {key}: {e}")
-            # Try to release lock
-            try:
-                await client.delete(lock_key)
-            except:
-                pass
             return False
     
+    def _get_script(self, client, source: str):
+        """Register a Lua script once and reuse it (EVALSHA with EVAL fallback)."""
+        script = self._scripts.get(source)
+        if script is None:
+            script = client.register_script(source)
+            self._scripts[source] = script
+        return script
+    
     def cache_key(self, *args, **kwargs) -> str:
         """
         Generate a cache key from arguments.
@@ -234,7 +365,8 @@ class CacheHelper:
             Generated cache key
         """
         key_data = f"{args}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # Non-cryptographic hash; the key only needs to be stable and well spread
+        return xxhash.xxh3_64_hexdigest(key_data.encode())
 
 
 def cached(ttl: Optional[int] = None, key_prefix: str = ""):
@@ -253,7 +385,8 @@ def cached(ttl: Optional[int] = None, key_prefix: str = ""):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cache = CacheHelper()
+            # Reuse the module-level helper instead of building one per call
+            cache = cache_helper
             
             # Generate cache key
             cache_key = f"{key_prefix}:{func.__name__}:{cache.cache_key(*args, **kwargs)}"
@@ -6,18 +6,118 @@ Protects sensitive information before sending to AI models.
 import re
 import logging
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
+from bisect import bisect_right
 from dataclasses import dataclass
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
+from functools import lru_cache
+
+import xxhash
 
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Key fragments whose values are always redacted from logs
+_SENSITIVE_KEYS = (
+    'password', 'api_key', 'secret', 'token', 'auth',
+    'credit_card', 'ssn', 'passport', 'private_key'
+)
+
+
+# Joins log values for a single scan; no pattern can match across it
+_VALUE_SEPARATOR = '\x00'
+
+@lru_cache(maxsize=32)
+def _compile_fused_pattern(patterns: Tuple[Tuple[str, str], ...]) -> re.Pattern:
+    """
+    Combine (name, regex) pairs into a single alternation.
+    
+    Each pattern is wrapped in a named group so a single scan over the text
+    finds every match and reports which pattern produced it.
+    """
+    return re.compile('|'.join(f"(?P<{name}>{pattern})" for name, pattern in patterns))
+
+
+@lru_cache(maxsize=4)
+def _derive_cipher(key: bytes) -> Fernet:
+    """
+    Build a Fernet cipher for a configured key.
+    
+    The PBKDF2 derivation is slow by design, so the result is memoized and
+    every DataSecurityHelper instance sharing a key reuses the same cipher.
+    """
+    # Derive a proper Fernet key if needed
+    if len(key) != 44:  # Fernet key must be 32 bytes base64-encoded (44 chars)
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=b'izh_ai_salt_2025',  # In production, use a secure random salt
+            iterations=100000,
+        )
+        derived_key = base64.urlsafe_b64encode(kdf.derive(key))
+        return Fernet(derived_key)
+    
+    return Fernet(key)
+
+
+_DIGIT_RE = re.compile(r'\d')
+_CC_SEP_RE = re.compile(r'[-\s]')
+
+
+def _mask_email(value: str) -> str:
+    """Mask email: john.doe@example.com -> j***@e***.com"""
+    parts = value.split('@')
+    if len(parts) != 2:
+        return _mask_generic(value)
+    local = parts[0][0] + '***' if len(parts[0]) > 1 else '***'
+    domain_parts = parts[1].split('.')
+    domain = domain_parts[0][0] + '***' if len(domain_parts[0]) > 1 else '***'
+    tld = '.' + '.'.join(domain_parts[1:]) if len(domain_parts) > 1 else ''
+    return f"{local}@{domain}{tld}"
+
+
+def _mask_phone(value: str) -> str:
+    """Mask phone: (123) 456-7890 -> (***) ***-7890"""
+    return _DIGIT_RE.sub('*', value[:-4]) + value[-4:]
+
+
+def _mask_ssn(value: str) -> str:
+    """Mask SSN: 123-45-6789 -> ***-**-6789"""
+    return '***-**-' + value[-4:]
+
+
+def _mask_credit_card(value: str) -> str:
+    """Mask credit card: 1234 5678 9012 3456 -> **** **** **** 3456"""
+    clean = _CC_SEP_RE.sub('', value)
+    masked = '*' * (len(clean) - 4) + clean[-4:]
+    # Restore original formatting
+    if '-' in value:
+        separator = '-'
+    elif ' ' in value:
+        separator = ' '
+    else:
+        return masked
+    return separator.join([masked[i:i+4] for i in range(0, len(masked), 4)])
+
+
+def _mask_ip_address(value: str) -> str:
+    """Mask IP: 192.168.1.1 -> ***.***.***.1"""
+    parts = value.split('.')
+    return '.'.join(['***'] * (len(parts) - 1) + [parts[-1]])
+
+
+def _mask_generic(value: str) -> str:
+    """Generic masking - show first and last char."""
+    if len(value) <= 2:
+        return '*' * len(value)
+    return value[0] + '*' * (len(value) - 2) + value[-1]
+
+
 @dataclass
 class MaskedData:
     """Container for masked data and mapping."""
@@ -36,13 +136,32 @@ class DataSecurityHelper:
         'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
         'credit_card': r'\b(?:\d{4}[-\s]?){3}\d{4}\b',
         'ip_address': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-        'api_key': r'\b[A-Za-z0-9]{32,}\b',
+        # Possessive run: a long alphanumeric blob is consumed once and never backtracked
+        'api_key': r'\b[A-Za-z0-9]{32,}+\b',
         'url': r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)',
         'date_of_birth': r'\b(?:0[1-9]|1[0-2])[/-](?:0[1-9]|[12][0-9]|3[01])[/-](?:19|20)\d{2}\b',
         'passport': r'\b[A-Z]{1,2}[0-9]{6,9}\b',
         'address': r'\b\d+\s+[A-Za-z]+\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Circle|Cir)\b',
     }
     
+    # Compiled once at class load; each pattern keeps its named group so
+    # matches report which pattern produced them
+    _COMPILED = {
+        name: _compile_fused_pattern(((name, pattern),))
+        for name, pattern in PATTERNS.items()
+    }
+    _FUSED_PATTERN = _compile_fused_pattern(tuple(PATTERNS.items()))
+    _NO_MATCH_PATTERN = re.compile(r'(?!)')
+    
+    # Format-preserving maskers by pattern name; others use _mask_generic
+    _MASKERS = {
+        'email': _mask_email,
+        'phone': _mask_phone,
+        'ssn': _mask_ssn,
+        'credit_card': _mask_credit_card,
+        'ip_address': _mask_ip_address,
+    }
+    
     def __init__(self):
         """Initialize data security helper."""
         self._cipher = self._initialize_cipher()
@@ -53,20 +172,10 @@ class DataSecurityHelper:
         """Initialize Fernet cipher with key from settings."""
         try:
             # Use encryption key from settings or generate one
-            key = settings.ENCRYPTION_KEY.encode() if hasattr(settings, 'ENCRYPTION_KEY') and settings.ENCRYPTION_KEY else Fernet.generate_key()
+            if not (hasattr(settings, 'ENCRYPTION_KEY') and settings.ENCRYPTION_KEY):
+                return Fernet(Fernet.generate_key())
             
-            # Derive a proper Fernet key if needed
-            if len(key) != 44:  # Fernet key must be 32 bytes base64-encoded (44 chars)
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=b'izh_ai_salt_2025',  # In production, use a secure random salt
-                    iterations=100000,
-                )
-                derived_key = base64.urlsafe_b64encode(kdf.derive(key))
-                return Fernet(derived_key)
-            
-            return Fernet(key)
+            return _derive_cipher(settings.ENCRYPTION_KEY.encode())
         except Exception as e:
             logger.error(f"Failed to initialize cipher: {e}")
             # Generate a temporary key for this session
@@ -96,45 +205,93 @@ class DataSecurityHelper:
                 patterns_found=[]
             )
         
-        masked_text = text
         token_map = {}
         patterns_found = []
         
-        # Use all patterns if none specified
-        patterns_to_use = patterns or list(self.PATTERNS.keys())
-        
-        for pattern_name in patterns_to_use:
-            if pattern_name not in self.PATTERNS:
-                continue
-                
-            pattern = self.PATTERNS[pattern_name]
-            matches = re.finditer(pattern, masked_text)
-            
-            for match in matches:
-                original_value = match.group(0)
-                
-                # Generate a unique token
-                token = self._generate_token(original_value, pattern_name)
-                
-                # Create masked replacement
-                if preserve_format:
-                    replacement = self._create_format_preserving_mask(original_value, pattern_name)
-                else:
-                    replacement = f"[{pattern_name.upper()}_{token}]"
-                
-                # Store mapping
-                token_map[replacement] = original_value
-                patterns_found.append(pattern_name)
-                
-                # Replace in text
-                masked_text = masked_text.replace(original_value, replacement, 1)
+        fused_pattern = self._get_fused_pattern(patterns)
+        
+        # Single pass over the text; the fused alternation reports which
+        # pattern matched via the named group
+        masked_text = self._apply_masks(
+            text,
+            fused_pattern.finditer(text),
+            preserve_format,
+            token_map,
+            patterns_found
+        )
         
         logger.info(f"Masked {len(token_map)} sensitive data items")
         
         return MaskedData(
             masked_text=masked_text,
             token_map=token_map,
-            patterns_found=list(set(patterns_found))
+            patterns_found=list(dict.fromkeys(patterns_found))
+        )
+    
+    def _apply_masks(
+        self,
+        text: str,
+        matches: Iterable[re.Match],
+        preserve_format: bool,
+        token_map: Dict[str, str],
+        patterns_found: List[str],
+        offset: int = 0
+    ) -> str:
+        """
+        Rebuild text with every match replaced by its mask.
+        
+        Args:
+            text: Text the matches were found in
+            matches: Fused-pattern matches, in order
+            preserve_format: Whether to preserve the format of masked data
+            token_map: Mapping to record masks in
+            patterns_found: List to record matched pattern names in
+            offset: Position of text inside the scanned buffer
+            
+        Returns:
+            Masked text
+        """
+        chunks = []
+        position = 0
+        for match in matches:
+            pattern_name = match.lastgroup
+            original_value = match.group(0)
+            
+            # Create masked replacement
+            if preserve_format:
+                replacement = self._create_format_preserving_mask(original_value, pattern_name)
+            else:
+                # Generate a unique token
+                token = self._generate_token(original_value, pattern_name)
+                replacement = f"[{pattern_name.upper()}_{token}]"
+            
+            # Store mapping
+            token_map[replacement] = original_value
+            patterns_found.append(pattern_name)
+            
+            # Slices instead of repeated str.replace calls
+            start = match.start() - offset
+            chunks.append(text[position:start])
+            chunks.append(replacement)
+            position = match.end() - offset
+        
+        chunks.append(text[position:])
+        return ''.join(chunks)
+    
+    def _get_fused_pattern(self, patterns: Optional[List[str]]) -> re.Pattern:
+        """Return the compiled pattern covering the requested pattern names."""
+        # Use all patterns if none specified
+        if not patterns:
+            return self._FUSED_PATTERN
+        
+        pattern_names = [name for name in dict.fromkeys(patterns) if name in self.PATTERNS]
+        if not pattern_names:
+            return self._NO_MATCH_PATTERN
+        if len(pattern_names) == 1:
+            return self._COMPILED[pattern_names[0]]
+        
+        return _compile_fused_pattern(
+            tuple((name, self.PATTERNS[name]) for name in pattern_names)
         )
     
     def unmask_data(self, text: str, token_map: Dict[str, str]) -> str:
@@ -148,12 +305,14 @@ class DataSecurityHelper:
         Returns:
             Unmasked text
         """
-        unmasked_text = text
+        if not token_map:
+            return text
         
-        for token, original_value in token_map.items():
-            unmasked_text = unmasked_text.replace(token, original_value)
+        # Longest tokens first so a token that prefixes another never wins
+        tokens = sorted(token_map, key=len, reverse=True)
+        token_pattern = re.compile('|'.join(map(re.escape, tokens)))
         
-        return unmasked_text
+        return token_pattern.sub(lambda match: token_map[match.group(0)], text)
     
     def encrypt_text(self, text: str) -> str:
         """
@@ -196,24 +355,29 @@ class DataSecurityHelper:
             logger.error(f"Decryption failed: {e}")
             return encrypted_text
     
-    def hash_pii(self, text: str, algorithm: str = 'sha256') -> str:
+    def hash_pii(self, text: str, algorithm: str = 'blake2b') -> str:
         """
         Create a one-way hash of PII for logging/analytics.
         
         Args:
             text: Text to hash
-            algorithm: Hash algorithm (sha256, sha512, md5)
+            algorithm: Hash algorithm (blake2b, sha256, sha512, md5);
+                use sha256 where compliance requires it
             
         Returns:
             Hexadecimal hash string
         """
+        if algorithm == 'blake2b':
+            # 128-bit BLAKE2b digest, faster than SHA-256 without SHA extensions
+            return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        
         hash_func = getattr(hashlib, algorithm, hashlib.sha256)
         return hash_func(text.encode()).hexdigest()
     
     def _generate_token(self, value: str, pattern_name: str) -> str:
         """Generate a unique token for a masked value."""
-        # Use first 8 chars of SHA256 hash for uniqueness
-        hash_val = hashlib.sha256(f"{value}{pattern_name}".encode()).hexdigest()[:8]
+        # Use first 8 chars of a fast non-cryptographic hash for uniqueness
+        hash_val = xxhash.xxh3_64_hexdigest(f"{value}{pattern_name}".encode())[:8]
         return hash_val.upper()
     
     def _create_format_preserving_mask(self, value: str, pattern_name: str) -> str:
@@ -227,45 +391,20 @@ class DataSecurityHelper:
         Returns:
             Masked value preserving format
         """
-        if pattern_name == 'email':
-            # Mask email: john.doe@example.com -> j***@e***.com
-            parts = value.split('@')
-            if len(parts) == 2:
-                local = parts[0][0] + '***' if len(parts[0]) > 1 else '***'
-                domain_parts = parts[1].split('.')
-                domain = domain_parts[0][0] + '***' if len(domain_parts[0]) > 1 else '***'
-                tld = '.' + '.'.join(domain_parts[1:]) if len(domain_parts) > 1 else ''
-                return f"{local}@{domain}{tld}"
-        
-        elif pattern_name == 'phone':
-            # Mask phone: (123) 456-7890 -> (***) ***-7890
-            return re.sub(r'\d', '*', value[:-4]) + value[-4:]
-        
-        elif pattern_name == 'ssn':
-            # Mask SSN: 123-45-6789 -> ***-**-6789
-            return '***-**-' + value[-4:]
-        
-        elif pattern_name == 'credit_card':
-            # Mask credit card: 1234 5678 9012 3456 -> **** **** **** 3456
-            clean = re.sub(r'[-\s]', '', value)
-            masked = '*' * (len(clean) - 4) + clean[-4:]
-            # Restore original formatting
-            if '-' in value:
-                return '-'.join([masked[i:i+4] for i in range(0, len(masked), 4)])
-            elif ' ' in value:
-                return ' '.join([masked[i:i+4] for i in range(0, len(masked), 4)])
-            return masked
-        
-        elif pattern_name == 'ip_address':
-            # Mask IP: 192.168.1.1 -> ***.***.***.1
-            parts = value.split('.')
-            return '.'.join(['***'] * (len(parts) - 1) + [parts[-1]])
-        
-        else:
-            # Generic masking - show first and last char
-            if len(value) <= 2:
-                return '*' * len(value)
-            return value[0] + '*' * (len(value) - 2) + value[-1]
+        masker = self._MASKERS.get(pattern_name, _mask_generic)
+        return masker(value)
+    
+    def has_pii(self, text: str) -> bool:
+        """
+        Check whether text contains any sensitive data pattern.
+        
+        Args:
+            text: Text to check
+            
+        Returns:
+            True if at least one pattern matches
+        """
+        return self._FUSED_PATTERN.search(text) is not None
     
     def redact_for_logging(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -277,32 +416,69 @@ class DataSecurityHelper:
         Returns:
             Redacted dictionary
         """
-        sensitive_keys = {
-            'password', 'api_key', 'secret', 'token', 'auth',
-            'credit_card', 'ssn', 'passport', 'private_key'
-        }
+        string_values: List[Tuple[Dict[str, Any], str, str]] = []
+        redacted = self._redact_keys(data, string_values)
         
+        if string_values and self.masking_enabled:
+            self._mask_string_values(string_values)
+        
+        return redacted
+    
+    def _redact_keys(
+        self,
+        data: Dict[str, Any],
+        string_values: List[Tuple[Dict[str, Any], str, str]]
+    ) -> Dict[str, Any]:
+        """Redact sensitive keys and collect string values for masking."""
         redacted = {}
         for key, value in data.items():
             key_lower = key.lower()
             
             # Check if key contains sensitive terms
-            if any(sensitive in key_lower for sensitive in sensitive_keys):
+            if any(sensitive in key_lower for sensitive in _SENSITIVE_KEYS):
                 redacted[key] = '[REDACTED]'
             elif isinstance(value, dict):
-                redacted[key] = self.redact_for_logging(value)
-            elif isinstance(value, str):
-                # Quick check for patterns in values
-                masked_data = self.mask_sensitive_data(value, preserve_format=False)
-                if masked_data.patterns_found:
-                    redacted[key] = masked_data.masked_text
-                else:
-                    redacted[key] = value
+                redacted[key] = self._redact_keys(value, string_values)
             else:
                 redacted[key] = value
+                if isinstance(value, str):
+                    string_values.append((redacted, key, value))
         
         return redacted
     
+    def _mask_string_values(
+        self,
+        string_values: List[Tuple[Dict[str, Any], str, str]]
+    ) -> None:
+        """
+        Mask PII in collected string values with a single scan.
+        
+        The values are joined with a separator no pattern can match, scanned
+        once, and each match is mapped back to its value by offset.
+        """
+        values = [value for _, _, value in string_values]
+        starts = []
+        offset = 0
+        for value in values:
+            starts.append(offset)
+            offset += len(value) + len(_VALUE_SEPARATOR)
+        
+        matches_by_value: Dict[int, List[re.Match]] = {}
+        for match in self._FUSED_PATTERN.finditer(_VALUE_SEPARATOR.join(values)):
+            index = bisect_right(starts, match.start()) - 1
+            matches_by_value.setdefault(index, []).append(match)
+        
+        for index, matches in matches_by_value.items():
+            container, key, value = string_values[index]
+            container[key] = self._apply_masks(
+                value,
+                matches,
+                preserve_format=False,
+                token_map={},
+                patterns_found=[],
+                offset=starts[index]
+            )
+    
     def sanitize_for_ai(
         self, 
         text: str,
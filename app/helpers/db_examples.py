@@ -1,20 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime
+
 from app.helpers.db_executor import query_executor
 
 
-async def create_user_example(email: str, name: str):
-    """Create a new user."""
-    query = """
+@dataclass(slots=True, frozen=True)
+class User:
+    """Row shape returned by the user lookups below."""
+    id: int
+    email: str
+    name: str
+    created_at: datetime
+
+
+query_executor.register_query(
+    "create_user",
+    """
         INSERT INTO users (email, name)
         VALUES ($1, $2)
         RETURNING id, email, name, created_at
     """
-    return await query_executor.fetch_one(query, email, name)
+)
+
+
+async def create_user_example(email: str, name: str):
+    """Create a new user."""
+    rows = await query_executor.run("create_user", email, name)
+    return User(**rows[0]) if rows else None
 
 
 async def get_user_by_id(user_id: int):
     """Get user by ID."""
-    query = "SELECT * FROM users WHERE id = $1"
-    return await query_executor.fetch_one(query, user_id)
+    query = "SELECT id, email, name, created_at FROM users WHERE id = $1"
+    return await query_executor.fetch_struct(User, query, user_id)
 
 
 async def get_all_users():
@@ -41,18 +59,15 @@ async def delete_user(user_id: int):
 
 
 async def create_conversation_with_message():
-    """Example of transaction usage."""
-    async with query_executor.transaction() as conn:
-        # Create conversation
-        conv = await conn.fetchrow(
-            "INSERT INTO conversations (user_id, title) VALUES ($1, $2) RETURNING id",
-            1, "New Conversation"
-        )
-        
-        # Create first message
-        await conn.execute(
-            "INSERT INTO messages (conversation_id, role, content) VALUES ($1, $2, $3)",
-            conv['id'], "user", "Hello!"
+    """Create a conversation and its first message in a single statement."""
+    query = """
+        WITH c AS (
+            INSERT INTO conversations (user_id, title)
+            VALUES ($1, $2)
+            RETURNING id
         )
-        
-        return conv['id']
+        INSERT INTO messages (conversation_id, role, content)
+        SELECT id, $3, $4 FROM c
+        RETURNING conversation_id
+    """
+    return await query_executor.fetch_val(query, 1, "New Conversation", "user", "Hello!")
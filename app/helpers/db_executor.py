@@ -1,11 +1,48 @@
-from typing import Any, Optional, List, Dict
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from typing import Any, Optional, List, Dict, Iterable, Union
 import asyncpg
 import logging
+import re
 
 from app.config.database import db_config
 
 logger = logging.getLogger(__name__)
 
+# Plain "INSERT INTO table (cols) VALUES ($1, ..., $n)" with nothing after it
+_SIMPLE_INSERT_RE = re.compile(
+    r'^\s*INSERT\s+INTO\s+(?P<table>[A-Za-z_][\w.]*)\s*'
+    r'\((?P<columns>[^)]*)\)\s*VALUES\s*'
+    r'\((?P<values>\s*\$\d+\s*(?:,\s*\$\d+\s*)*)\)\s*;?\s*$',
+    re.IGNORECASE
+)
+_COPY_THRESHOLD = 50
+
+# Statements that write and, without RETURNING, produce no rows
+_DML_RE = re.compile(r'^\s*(INSERT|UPDATE|DELETE)\b', re.IGNORECASE)
+_RETURNING_RE = re.compile(r'\bRETURNING\b', re.IGNORECASE)
+
+
+class _RecordView(Mapping):
+    """Read-only mapping over an asyncpg.Record, without copying it into a dict."""
+    
+    __slots__ = ("_r",)
+    
+    def __init__(self, record: asyncpg.Record):
+        self._r = record
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._r[key]
+    
+    def __iter__(self):
+        return iter(self._r.keys())
+    
+    def __len__(self) -> int:
+        return len(self._r)
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self._r.items())!r})"
+
 
 class QueryExecutor:
     """Execute raw SQL queries on PostgreSQL database."""
@@ -13,6 +50,45 @@ class QueryExecutor:
     def __init__(self):
         """Initialize query executor."""
         self.db = db_config
+        self._known_queries: Dict[str, tuple] = {}
+    
+    def register_query(self, name: str, sql: str) -> None:
+        """
+        Register a frequently used statement under a name.
+        
+        Args:
+            name: Name used with run()
+            sql: SQL query string
+        """
+        returns_rows = not _DML_RE.match(sql) or bool(_RETURNING_RE.search(sql))
+        self._known_queries[name] = (sql, returns_rows)
+    
+    async def run(
+        self,
+        name: str,
+        *args,
+        timeout: Optional[float] = None
+    ) -> Union[str, List[Mapping]]:
+        """
+        Run a statement registered with register_query.
+        
+        The SQL text is fixed per name, so after the first call on a
+        connection every run hits asyncpg's prepared-statement cache and
+        is a plain Bind/Execute.
+        
+        Args:
+            name: Registered query name
+            *args: Query parameters
+            timeout: Query timeout in seconds
+            
+        Returns:
+            List of rows for statements that return rows, otherwise the
+            execution status
+        """
+        sql, returns_rows = self._known_queries[name]
+        if returns_rows:
+            return await self.fetch_all(sql, *args, timeout=timeout)
+        return await self.execute(sql, *args, timeout=timeout)
     
     async def execute(
         self, 
@@ -40,12 +116,46 @@ class QueryExecutor:
             logger.error(f"Query execution failed: {e}")
             raise
     
-    async def fetch_one(
+    async def execute_async_commit(
         self, 
         query: str, 
         *args,
         timeout: Optional[float] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> str:
+        """
+        Execute a write without waiting for the WAL flush on commit.
+        
+        Runs the query with synchronous_commit off for its transaction only.
+        A server crash can lose the last few such commits (never corrupts
+        data), so use it only for writes that are cheap to redo, such as
+        derived scores or logs; keep user and billing data on execute().
+        
+        Args:
+            query: SQL query string
+            *args: Query parameters
+            timeout: Query timeout in seconds
+            
+        Returns:
+            Query execution status
+        """
+        try:
+            async with self.db.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute("SET LOCAL synchronous_commit = off")
+                    result = await conn.execute(query, *args, timeout=timeout)
+                logger.debug(f"Executed query (async commit): {query[:100]}... | Result: {result}")
+                return result
+        except Exception as e:
+            logger.error(f"Async commit execution failed: {e}")
+            raise
+    
+    async def fetch_one(
+        self, 
+        query: str, 
+        *args,
+        timeout: Optional[float] = None,
+        as_dict: bool = False
+    ) -> Optional[Union[Mapping, Dict[str, Any]]]:
         """
         Fetch a single row from the database.
         
@@ -53,41 +163,81 @@ class QueryExecutor:
             query: SQL query string
             *args: Query parameters
             timeout: Query timeout in seconds
+            as_dict: Return a mutable dict instead of a read-only view
             
         Returns:
-            Dictionary representing the row, or None
+            Mapping representing the row, or None
         """
         try:
             async with self.db.pool.acquire() as conn:
                 row = await conn.fetchrow(query, *args, timeout=timeout)
                 if row:
-                    return dict(row)
+                    return dict(row) if as_dict else _RecordView(row)
                 return None
         except Exception as e:
             logger.error(f"Fetch one failed: {e}")
             raise
     
+    async def fetch_struct(
+        self,
+        struct_cls: type,
+        query: str,
+        *args,
+        timeout: Optional[float] = None
+    ) -> Optional[Any]:
+        """
+        Fetch a single row into a fixed-shape class, e.g. a slotted dataclass.
+        
+        The query's column names must match the class's fields.
+        
+        Args:
+            struct_cls: Class constructed with the row's columns as keywords
+            query: SQL query string
+            *args: Query parameters
+            timeout: Query timeout in seconds
+            
+        Returns:
+            Instance of struct_cls, or None
+        """
+        try:
+            async with self.db.pool.acquire() as conn:
+                row = await conn.fetchrow(query, *args, timeout=timeout)
+                if row:
+                    return struct_cls(**row)
+                return None
+        except Exception as e:
+            logger.error(f"Fetch struct failed: {e}")
+            raise
+    
     async def fetch_all(
         self, 
         query: str, 
         *args,
-        timeout: Optional[float] = None
-    ) -> List[Dict[str, Any]]:
+        timeout: Optional[float] = None,
+        as_dict: bool = False
+    ) -> List[Union[Mapping, Dict[str, Any]]]:
         """
         Fetch all rows from the database.
         
+        Rows are returned as read-only views over the asyncpg records, so
+        large result sets aren't copied into one dict per row. Pass
+        as_dict=True when the caller needs to mutate rows or json.dumps them.
+        
         Args:
             query: SQL query string
             *args: Query parameters
             timeout: Query timeout in seconds
+            as_dict: Return mutable dicts instead of read-only views
             
         Returns:
-            List of dictionaries representing rows
+            List of mappings representing rows
         """
         try:
             async with self.db.pool.acquire() as conn:
                 rows = await conn.fetch(query, *args, timeout=timeout)
-                return [dict(row) for row in rows]
+                if as_dict:
+                    return [dict(row) for row in rows]
+                return [_RecordView(row) for row in rows]
         except Exception as e:
             logger.error(f"Fetch all failed: {e}")
             raise
@@ -128,11 +278,23 @@ class QueryExecutor:
         """
         Execute a query multiple times with different parameters.
         
+        Simple INSERTs (positional placeholders only, no ON CONFLICT or
+        RETURNING) with more than _COPY_THRESHOLD rows are routed through
+        copy_insert, so they run as a single COPY instead of one round-trip
+        per row. Anything else falls back to executemany.
+        
         Args:
             query: SQL query string
             args_list: List of parameter tuples
             timeout: Query timeout in seconds
         """
+        if len(args_list) > _COPY_THRESHOLD:
+            target = self._parse_simple_insert(query)
+            if target:
+                table, columns = target
+                await self.copy_insert(table, columns, args_list, timeout=timeout)
+                return
+        
         try:
             async with self.db.pool.acquire() as conn:
                 await conn.executemany(query, args_list, timeout=timeout)
@@ -141,46 +303,100 @@ class QueryExecutor:
             logger.error(f"Execute many failed: {e}")
             raise
     
+    async def copy_insert(
+        self,
+        table: str,
+        columns: List[str],
+        records: Iterable[tuple],
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Bulk insert rows with COPY ... FROM STDIN (BINARY).
+        
+        COPY does not support RETURNING or ON CONFLICT, so use it only
+        for plain appends.
+        
+        Args:
+            table: Table name, optionally schema-qualified
+            columns: Column names, in the order of each record
+            records: Iterable of row tuples
+            timeout: Query timeout in seconds
+            
+        Returns:
+            COPY command status
+        """
+        schema_name, _, table_name = table.rpartition('.')
+        try:
+            async with self.db.pool.acquire() as conn:
+                result = await conn.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name or None,
+                    timeout=timeout
+                )
+                logger.debug(f"Copied records into {table}: {result}")
+                return result
+        except Exception as e:
+            logger.error(f"Copy insert failed: {e}")
+            raise
+    
+    @staticmethod
+    def _parse_simple_insert(query: str) -> Optional[tuple]:
+        """
+        Extract the target of a COPY-compatible INSERT.
+        
+        Args:
+            query: SQL query string
+            
+        Returns:
+            (table, columns) tuple, or None if the query can't use COPY
+        """
+        match = _SIMPLE_INSERT_RE.match(query)
+        if not match:
+            return None
+        
+        table = match.group('table')
+        columns = [c.strip() for c in match.group('columns').split(',')]
+        placeholders = [p.strip() for p in match.group('values').split(',')]
+        
+        # INSERT folds unquoted identifiers to lowercase, but asyncpg quotes
+        # the names it passes to COPY, so only plain lowercase names match
+        for identifier in (table, *columns):
+            if '"' in identifier or identifier != identifier.lower():
+                return None
+        
+        # COPY maps record fields to columns by position, so the
+        # placeholders must be exactly $1..$n in order
+        if placeholders != [f"${i}" for i in range(1, len(columns) + 1)]:
+            return None
+        
+        return table, columns
+    
+    @asynccontextmanager
     async def transaction(self):
         """
-        Get a transaction context manager.
+        Run a block of statements in a single transaction.
         
         Usage:
             async with query_executor.transaction() as conn:
                 await conn.execute("INSERT INTO ...")
                 await conn.execute("UPDATE ...")
         """
-        conn = await self.db.pool.acquire()
-        return TransactionContext(conn, self.db)
-
-
-class TransactionContext:
-    """Context manager for database transactions."""
-    
-    def __init__(self, conn: asyncpg.Connection, db):
-        """Initialize transaction context."""
-        self.conn = conn
-        self.db = db
-        self.transaction = None
-    
-    async def __aenter__(self):
-        """Enter transaction context."""
-        self.transaction = self.conn.transaction()
-        await self.transaction.start()
-        return self.conn
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Exit transaction context."""
-        try:
-            if exc_type is not None:
-                await self.transaction.rollback()
+        async with self.db.pool.acquire() as conn:
+            tx = conn.transaction()
+            await tx.start()
+            try:
+                yield conn
+            except BaseException:
+                await tx.rollback()
                 logger.warning("Transaction rolled back due to error")
+                raise
             else:
-                await self.transaction.commit()
+                await tx.commit()
                 logger.debug("Transaction committed")
-        finally:
-            await self.db.release_connection(self.conn)
 
 
 # Global query executor instance
 query_executor = QueryExecutor()
+
@@ -0,0 +1,313 @@
+import asyncio
+import logging
+import os
+from typing import Optional, Dict, Any, Union
+import orjson
+from cryptography.hazmat.primitives.asymmetric import x25519
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from app.config.settings import settings
+
+try:
+    from pybase64 import b64encode, b64decode
+except ImportError:  # pybase64 is optional
+    from base64 import b64encode, b64decode
+
+logger = logging.getLogger(__name__)
+
+# Envelope: ephemeral X25519 public key | nonce | AES-GCM ciphertext with tag
+_PUBLIC_KEY_SIZE = 32
+_GCM_NONCE_SIZE = 12
+_HKDF_INFO = b"izh-ai-v1"
+
+
+def _derive_aes_key(shared_secret: bytes) -> bytes:
+    """Derive an AES-256 key from an X25519 shared secret."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=_HKDF_INFO
+    ).derive(shared_secret)
+
+
+class ECEncryptionHelper:
+    """Helper class for hybrid encryption (AES-256-GCM + X25519) of API responses.
+    
+    Each message uses a fresh ephemeral X25519 key pair; the AES key is
+    derived from the ECDH shared secret with HKDF, so no key has to be
+    wrapped. Much cheaper than RSA-OAEP for small messages.
+    """
+    
+    def __init__(
+        self,
+        private_key_path: Optional[str] = None,
+        private_key: Optional[x25519.X25519PrivateKey] = None,
+        public_key: Optional[x25519.X25519PublicKey] = None
+    ):
+        """
+        Initialize X25519 encryption helper.
+        
+        Args:
+            private_key_path: Path to private key PEM file (optional)
+            private_key: X25519 private key object (optional)
+            public_key: X25519 public key object (optional)
+        
+        Note: If no keys are provided, a new key pair will be generated.
+        """
+        self.private_key = private_key
+        self.public_key = public_key
+        
+        if private_key_path:
+            self.private_key = self._load_private_key(private_key_path)
+        
+        if self.private_key and not self.public_key:
+            self.public_key = self.private_key.public_key()
+        
+        if not self.private_key and not self.public_key:
+            logger.warning("No X25519 keys provided. Generating new key pair.")
+            self.private_key = x25519.X25519PrivateKey.generate()
+            self.public_key = self.private_key.public_key()
+    
+    def _load_private_key(self, key_path: str) -> Optional[x25519.X25519PrivateKey]:
+        """Load private key from PEM file."""
+        try:
+            with open(key_path, 'rb') as f:
+                private_key = serialization.load_pem_private_key(f.read(), password=None)
+            logger.info(f"Loaded private key from {key_path}")
+            return private_key
+        except Exception as e:
+            logger.error(f"Failed to load private key from {key_path}: {e}")
+            return None
+    
+    def get_public_key_pem(self) -> Optional[str]:
+        """
+        Get public key as PEM string.
+        
+        Returns:
+            Public key as PEM string, or None if not available
+        """
+        if not self.public_key:
+            logger.error("No public key available")
+            return None
+        
+        pem = self.public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        return pem.decode('utf-8')
+    
+    def encrypt(
+        self,
+        data: Union[str, bytes, Dict[str, Any]],
+        public_key: Optional[x25519.X25519PublicKey] = None
+    ) -> str:
+        """
+        Encrypt data using hybrid encryption (AES-256-GCM + X25519).
+        
+        Args:
+            data: Data to encrypt (string, bytes, or dict)
+            public_key: Public key to use (uses self.public_key if not provided)
+        
+        Returns:
+            Base64 string of the envelope: ephemeral public key (32 bytes),
+            12-byte nonce and the AES-GCM ciphertext with its tag
+        """
+        if not public_key and not self.public_key:
+            raise ValueError("No public key available for encryption")
+        
+        recipient_key = public_key or self.public_key
+        
+        # Convert data to bytes
+        if isinstance(data, dict):
+            data_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        elif isinstance(data, str):
+            data_bytes = data.encode('utf-8')
+        else:
+            data_bytes = data
+        
+        ephemeral_key = x25519.X25519PrivateKey.generate()
+        aes_key = _derive_aes_key(ephemeral_key.exchange(recipient_key))
+        
+        nonce = os.urandom(_GCM_NONCE_SIZE)
+        encrypted_data = AESGCM(aes_key).encrypt(nonce, data_bytes, None)
+        
+        envelope = b"".join((
+            ephemeral_key.public_key().public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw
+            ),
+            nonce,
+            encrypted_data
+        ))
+        return b64encode(envelope).decode('ascii')
+    
+    def decrypt(
+        self,
+        encrypted_data: str,
+        private_key: Optional[x25519.X25519PrivateKey] = None
+    ) -> bytes:
+        """
+        Decrypt data using hybrid decryption (AES-256-GCM + X25519).
+        
+        Args:
+            encrypted_data: Base64 envelope produced by encrypt()
+            private_key: Private key to use (uses self.private_key if not provided)
+        
+        Returns:
+            Decrypted data as bytes
+        """
+        if not private_key and not self.private_key:
+            raise ValueError("No private key available for decryption")
+        
+        key_to_use = private_key or self.private_key
+        
+        try:
+            blob = b64decode(encrypted_data, validate=True)
+            nonce_end = _PUBLIC_KEY_SIZE + _GCM_NONCE_SIZE
+            if len(blob) <= nonce_end:
+                raise ValueError("Truncated encrypted data")
+            
+            ephemeral_public = x25519.X25519PublicKey.from_public_bytes(blob[:_PUBLIC_KEY_SIZE])
+            aes_key = _derive_aes_key(key_to_use.exchange(ephemeral_public))
+            
+            return AESGCM(aes_key).decrypt(blob[_PUBLIC_KEY_SIZE:nonce_end], blob[nonce_end:], None)
+        except Exception as e:
+            logger.error(f"Decryption failed: {e}")
+            raise ValueError(f"Failed to decrypt data: {e}")
+    
+    def decrypt_json(
+        self,
+        encrypted_data: str,
+        private_key: Optional[x25519.X25519PrivateKey] = None
+    ) -> Dict[str, Any]:
+        """
+        Decrypt and parse JSON data.
+        
+        Args:
+            encrypted_data: Base64 envelope produced by encrypt()
+            private_key: Private key to use (uses self.private_key if not provided)
+        
+        Returns:
+            Decrypted JSON data as dictionary
+        """
+        decrypted_bytes = self.decrypt(encrypted_data, private_key)
+        return orjson.loads(decrypted_bytes)
+    
+    def encrypt_api_response(
+        self,
+        response_data: Dict[str, Any],
+        public_key: Optional[x25519.X25519PublicKey] = None
+    ) -> Dict[str, Any]:
+        """
+        Encrypt API response data using hybrid encryption (AES-256-GCM + X25519).
+        
+        Args:
+            response_data: API response dictionary to encrypt
+            public_key: Public key to use (uses self.public_key if not provided)
+        
+        Returns:
+            Dictionary with encrypted data
+        """
+        try:
+            encrypted = self.encrypt(response_data, public_key)
+            return {
+                "encrypted": True,
+                "data": encrypted,
+                "algorithm": "AES256-GCM-X25519-HKDF-SHA256"
+            }
+        except ValueError as e:
+            logger.error(f"Failed to encrypt API response: {e}")
+            return {
+                "encrypted": False,
+                "error": str(e),
+                "data": response_data  # Return unencrypted as fallback
+            }
+    
+    def decrypt_api_response(
+        self,
+        encrypted_response: Dict[str, Any],
+        private_key: Optional[x25519.X25519PrivateKey] = None
+    ) -> Dict[str, Any]:
+        """
+        Decrypt API response data.
+        
+        Args:
+            encrypted_response: Encrypted response dictionary
+            private_key: Private key to use (uses self.private_key if not provided)
+        
+        Returns:
+            Decrypted API response dictionary
+        """
+        if not encrypted_response.get("encrypted"):
+            return encrypted_response.get("data", encrypted_response)
+        
+        try:
+            encrypted_data = encrypted_response.get("data")
+            if not encrypted_data:
+                raise ValueError("No encrypted data found in response")
+            
+            return self.decrypt_json(encrypted_data, private_key)
+        except Exception as e:
+            logger.error(f"Failed to decrypt API response: {e}")
+            raise ValueError(f"Failed to decrypt API response: {e}")
+    
+    async def encrypt_api_response_async(
+        self,
+        response_data: Dict[str, Any],
+        public_key: Optional[x25519.X25519PublicKey] = None
+    ) -> Dict[str, Any]:
+        """
+        encrypt_api_response() run in the default executor.
+        
+        Args:
+            response_data: API response dictionary to encrypt
+            public_key: Public key to use (uses self.public_key if not provided)
+        
+        Returns:
+            Dictionary with encrypted data
+        """
+        return await asyncio.to_thread(self.encrypt_api_response, response_data, public_key)
+    
+    async def decrypt_api_response_async(
+        self,
+        encrypted_response: Dict[str, Any],
+        private_key: Optional[x25519.X25519PrivateKey] = None
+    ) -> Dict[str, Any]:
+        """
+        decrypt_api_response() run in the default executor.
+        
+        Args:
+            encrypted_response: Encrypted response dictionary
+            private_key: Private key to use (uses self.private_key if not provided)
+        
+        Returns:
+            Decrypted API response dictionary
+        """
+        return await asyncio.to_thread(self.decrypt_api_response, encrypted_response, private_key)
+
+
+def get_encryption_helper(scheme: str = "rsa"):
+    """
+    Get the global hybrid encryption helper for a key-wrapping scheme.
+    
+    Args:
+        scheme: "rsa" (RSA-OAEP key wrap) or "x25519" (ECDH key agreement)
+    
+    Returns:
+        RSAEncryptionHelper or ECEncryptionHelper instance
+    """
+    if scheme == "x25519":
+        return ec_encryption_helper
+    if scheme == "rsa":
+        from app.helpers.rsa_encryption import rsa_encryption_helper
+        return rsa_encryption_helper
+    raise ValueError(f"Unknown encryption scheme: {scheme}")
+
+
+# Global X25519 encryption helper instance
+ec_encryption_helper = ECEncryptionHelper(
+    private_key_path=getattr(settings, 'EC_PRIVATE_KEY_PATH', None)
+)
@@ -1,11 +1,16 @@
 import os
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 
+import httpx
+import orjson
 from pydantic import BaseModel
 from app.config.settings import settings
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
 from toon import encode
 
 logger = logging.getLogger(__name__)
@@ -47,7 +52,19 @@ class MultipleItinerariesOutput(BaseModel):
 
 os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY
 
-llm = OpenAIModel(settings.OPENAI_MODEL)
+# One keep-alive pool for every OpenAI call; closed on app shutdown
+shared_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+
+llm = OpenAIModel(
+    settings.OPENAI_MODEL,
+    provider=OpenAIProvider(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=shared_http_client,
+    ),
+)
 
 # The KEY — this is the correct structured-output way
 itinerary_agent = Agent(
@@ -56,28 +73,8 @@ itinerary_agent = Agent(
 )
 
 
-class OpenAIHelper:
-
-    async def generate_itinerary(
-        self,
-        nlp_data: Dict[str, Any],
-        poi_data: List[Dict[str, Any]],
-        user_interests: Dict[str, float],
-        food_preferences: Dict[str, bool]
-    ) -> MultipleItinerariesOutput:
-            
-        """Generates a detailed itinerary using OpenAI based on NLP data, POI data, user interests, and food preferences."""
-
-        encoded_nlp_data = encode(nlp_data)
-        encoded_poi_data = encode(poi_data)
-        encoded_user_interests = encode(user_interests)
-        encoded_food_preferences = encode(food_preferences)
-        print("Encoded NLP Data:", encoded_nlp_data)
-        print("Encoded POI Data:", encoded_poi_data)
-        print("Encoded User Interests:", encoded_user_interests)
-        print("Encoded Food Preferences:", encoded_food_preferences)
-
-        prompt = f"""
+# Static part of the itinerary prompt; only the encoded inputs are filled in per request
+_PROMPT_TEMPLATE = """
         Produce MULTIPLE itinerary OPTIONS using the exact schema below.
 
         Return exactly 3 different itineraries inside an array called `itineraries`.
@@ -124,15 +121,93 @@ class OpenAIHelper:
         - Balance sightseeing, meals, rest, and travel
 
         NLP_DATA:
-        {encoded_nlp_data}
+        {nlp_data}
 
         POI_DATA:
-        {encoded_poi_data}
+        {poi_data}
 
         USER_INTERESTS:
-        {encoded_user_interests}
+        {user_interests}
         """
 
+
+@lru_cache(maxsize=256)
+def _encode_food_preferences(items: Tuple[Tuple[str, bool], ...]) -> str:
+    """Encode food preferences once per distinct combination."""
+    return encode(dict(items))
+
+
+_POI_ENCODE_CACHE_SIZE = 512
+_poi_encode_cache: Dict[bytes, str] = {}
+
+
+def _encode_poi_data(poi_data: List[Dict[str, Any]]) -> str:
+    """
+    Encode POI data, reusing the result for identical POI lists.
+    
+    POI lists are shared by every request for the same destination, so
+    they are keyed by a hash of their content rather than re-encoded.
+    
+    Args:
+        poi_data: List of POI dictionaries
+        
+    Returns:
+        Encoded POI data
+    """
+    key = hashlib.blake2b(
+        orjson.dumps(poi_data, default=str, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).digest()
+    
+    encoded = _poi_encode_cache.get(key)
+    if encoded is None:
+        encoded = encode(poi_data)
+        if len(_poi_encode_cache) >= _POI_ENCODE_CACHE_SIZE:
+            # Evict the oldest entry
+            del _poi_encode_cache[next(iter(_poi_encode_cache))]
+        _poi_encode_cache[key] = encoded
+    return encoded
+
+
+class OpenAIHelper:
+
+    async def generate_itinerary(
+        self,
+        nlp_data: Dict[str, Any],
+        poi_data: List[Dict[str, Any]],
+        user_interests: Dict[str, float],
+        food_preferences: Dict[str, bool]
+    ) -> MultipleItinerariesOutput:
+            
+        """Generates a detailed itinerary using OpenAI based on NLP data, POI data, user interests, and food preferences."""
+
+        encoded_nlp_data = encode(nlp_data)
+        encoded_poi_data = _encode_poi_data(poi_data)
+        encoded_user_interests = encode(user_interests)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Food preferences aren't part of the prompt; encode them only to log
+            encoded_food_preferences = _encode_food_preferences(
+                tuple(sorted(food_preferences.items()))
+            )
+            logger.debug(
+                "Encoded payload sizes: nlp=%d poi=%d interests=%d food=%d",
+                len(encoded_nlp_data),
+                len(encoded_poi_data),
+                len(encoded_user_interests),
+                len(encoded_food_preferences),
+            )
+            logger.debug("Encoded NLP Data: %s", encoded_nlp_data)
+            logger.debug("Encoded POI Data: %s", encoded_poi_data)
+            logger.debug("Encoded User Interests: %s", encoded_user_interests)
+            logger.debug("Encoded Food Preferences: %s", encoded_food_preferences)
+
+        prompt = _PROMPT_TEMPLATE.format_map({
+            "nlp_data": encoded_nlp_data,
+            "poi_data": encoded_poi_data,
+            "user_interests": encoded_user_interests,
+        })
+
         result = await itinerary_agent.run(prompt)
         return result.output
 
@@ -1,18 +1,137 @@
+import asyncio
 import logging
 import json
-import base64
+import hashlib
 import os
+import struct
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any, Union
 from pathlib import Path
+import orjson
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
 
 from app.config.settings import settings
 
+try:
+    from pybase64 import b64encode, b64decode
+except ImportError:  # pybase64 is optional
+    from base64 import b64encode, b64decode
+
+try:
+    from Crypto.Cipher import AES as _PCAES
+except ImportError:  # PyCryptodome is optional
+    _PCAES = None
+
 logger = logging.getLogger(__name__)
 
+# Envelope: key_len (2B, big-endian) | RSA-encrypted key | nonce | tag | ciphertext
+# A key_len of 0 means the key is a reused session key, and the RSA-encrypted
+# key is replaced by the session id. _SESSION_START_FLAG set in key_len marks
+# the envelope that starts a session, so only its key is kept by the receiver
+_KEY_LEN = struct.Struct(">H")
+_SESSION_START_FLAG = 0x8000
+_GCM_NONCE_SIZE = 12
+_GCM_TAG_SIZE = 16
+_AES_BLOCK_SIZE = 16
+_STREAM_CHUNK_SIZE = 64 * 1024
+_SESSION_ID_SIZE = 16
+_SESSION_MAX_MESSAGES = 1 << 20  # rekey well before random-nonce GCM limits
+_SESSION_CACHE_SIZE = 1024
+_RESPONSE_CACHE_SIZE = 1024
+
+
+def _session_id(encrypted_aes_key: bytes) -> bytes:
+    """Derive the session id both sides use for an RSA-encrypted AES key."""
+    return hashlib.sha256(encrypted_aes_key).digest()[:_SESSION_ID_SIZE]
+
+
+def _aes_gcm_encrypt_into(
+    key: bytes,
+    iv: bytes,
+    plaintext: Union[str, bytes],
+    out: memoryview
+) -> bytes:
+    """AES-GCM encrypt plaintext into out, via PyCryptodome when installed.
+    
+    The plaintext is fed through the cipher in chunks, so an ASCII str is
+    encoded piecewise and the ciphertext is written straight into out,
+    without full-size intermediate copies.
+    
+    Args:
+        key: AES key
+        iv: GCM nonce
+        plaintext: Bytes, or a str containing only ASCII characters
+        out: Writable buffer of exactly len(plaintext) bytes
+        
+    Returns:
+        GCM authentication tag
+    """
+    if isinstance(plaintext, (bytes, bytearray)):
+        plaintext = memoryview(plaintext)
+    
+    if _PCAES is not None:
+        cipher = _PCAES.new(key, _PCAES.MODE_GCM, nonce=iv)
+    else:
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(iv)).encryptor()
+    
+    for start in range(0, len(plaintext), _STREAM_CHUNK_SIZE):
+        chunk = plaintext[start:start + _STREAM_CHUNK_SIZE]
+        if isinstance(chunk, str):
+            chunk = chunk.encode('ascii')
+        target = out[start:start + len(chunk)]
+        if _PCAES is not None:
+            cipher.encrypt(chunk, output=target)
+        else:
+            encryptor.update_into(chunk, target)
+    
+    if _PCAES is not None:
+        return cipher.digest()
+    encryptor.finalize()
+    return encryptor.tag
+
+
+def _aes_gcm_decrypt(key: bytes, iv: bytes, data: bytes, tag: bytes) -> bytes:
+    """AES-GCM decrypt and authenticate data, via PyCryptodome when installed."""
+    if _PCAES is not None:
+        return _PCAES.new(key, _PCAES.MODE_GCM, nonce=iv).decrypt_and_verify(data, tag)
+    decryptor = Cipher(algorithms.AES(key), modes.GCM(iv, tag)).decryptor()
+    return decryptor.update(data) + decryptor.finalize()
+
+
+def _aes_cbc_decrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
+    """AES-CBC decrypt without unpadding, for payloads from before GCM."""
+    if _PCAES is not None:
+        return _PCAES.new(key, _PCAES.MODE_CBC, iv).decrypt(data)
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+    return decryptor.update(data) + decryptor.finalize()
+
+
+def _unpad_pkcs7(data: bytes) -> bytes:
+    """
+    Strip and validate PKCS#7 padding from an AES-CBC plaintext.
+    
+    The padding bytes are checked as one integer comparison over the last
+    block rather than a byte-by-byte loop.
+    
+    Args:
+        data: Decrypted plaintext, a whole number of AES blocks
+        
+    Returns:
+        Plaintext without padding
+    """
+    pad_length = data[-1] if data else 0
+    if not 0 < pad_length <= _AES_BLOCK_SIZE or len(data) % _AES_BLOCK_SIZE:
+        raise ValueError("Invalid padding")
+    
+    tail = int.from_bytes(data[-_AES_BLOCK_SIZE:], "big")
+    expected = int.from_bytes(bytes((pad_length,)) * pad_length, "big")
+    if (tail & ((1 << (8 * pad_length)) - 1)) ^ expected:
+        raise ValueError("Invalid padding")
+    return data[:-pad_length]
+
 
 class RSAEncryptionHelper:
     """Helper class for hybrid encryption (AES-256 + RSA) of API responses.
@@ -39,7 +158,22 @@ class RSAEncryptionHelper:
             
         Note: If no keys are provided, new keys will be generated.
         """
-        self.backend = default_backend()
+        # OAEP parameters are the same for every message; build them once
+        self._oaep = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+        # Recipient key fingerprint -> [session_id, aes_key, messages sent]
+        self._send_sessions: OrderedDict = OrderedDict()
+        # Session id -> AES key unwrapped from a received envelope
+        self._recv_sessions: OrderedDict = OrderedDict()
+        # Payload + recipient digest -> envelope, for encrypt_api_response(cache_ok=True)
+        self._response_cache: OrderedDict = OrderedDict()
+        # Guards the session and response caches, which worker threads share
+        self._cache_lock = threading.Lock()
+        # (last key fingerprinted, its fingerprint), swapped as one tuple
+        self._last_fingerprint: tuple = (None, b"")
         self.private_key = private_key
         self.public_key = public_key
         
@@ -80,8 +214,7 @@ class RSAEncryptionHelper:
         """
         private_key = rsa.generate_private_key(
             public_exponent=65537,
-            key_size=key_size,
-            backend=self.backend
+            key_size=key_size
         )
         public_key = private_key.public_key()
         
@@ -94,8 +227,7 @@ class RSAEncryptionHelper:
             with open(key_path, 'rb') as f:
                 private_key = serialization.load_pem_private_key(
                     f.read(),
-                    password=None,
-                    backend=self.backend
+                    password=None
                 )
             logger.info(f"Loaded private key from {key_path}")
             return private_key
@@ -108,8 +240,7 @@ class RSAEncryptionHelper:
         try:
             with open(key_path, 'rb') as f:
                 public_key = serialization.load_pem_public_key(
-                    f.read(),
-                    backend=self.backend
+                    f.read()
                 )
             logger.info(f"Loaded public key from {key_path}")
             return public_key
@@ -208,7 +339,8 @@ class RSAEncryptionHelper:
     def encrypt(
         self,
         data: Union[str, bytes, Dict[str, Any]],
-        public_key: Optional[rsa.RSAPublicKey] = None
+        public_key: Optional[rsa.RSAPublicKey] = None,
+        reuse_session: bool = False
     ) -> str:
         """
         Encrypt data using hybrid encryption (AES-256 + RSA).
@@ -216,67 +348,74 @@ class RSAEncryptionHelper:
         The data is encrypted with AES-256, and the AES key is encrypted with RSA.
         This allows encryption of data of any size.
         
+        With reuse_session, the AES key is wrapped with RSA only for the first
+        message to a recipient; later messages reference it by session id and
+        skip RSA on both ends. The recipient must keep its helper's session
+        cache (or decrypt the first message) to read them.
+        
         Args:
             data: Data to encrypt (string, bytes, or dict)
             public_key: Public key to use (uses self.public_key if not provided)
+            reuse_session: Reuse a per-recipient AES session key
             
         Returns:
-            JSON string containing encrypted_key (RSA-encrypted AES key), 
-            encrypted_data (AES-encrypted data), and iv (initialization vector),
-            all base64-encoded
+            Base64 string of the binary envelope: key length (2 bytes,
+            big-endian), RSA-encrypted AES key, 12-byte nonce, 16-byte GCM
+            tag and the AES-GCM ciphertext
         """
-        if not public_key and not self.public_key:
-            raise ValueError("No public key available for encryption")
-        
         rsa_key_to_use = public_key or self.public_key
+        if rsa_key_to_use is None:
+            raise ValueError("No public key available for encryption")
         
-        # Convert data to bytes
+        # Convert data to bytes, or keep an ASCII str (one byte per char)
+        # so it is encoded chunk by chunk while encrypting
         if isinstance(data, dict):
-            data_bytes = json.dumps(data).encode('utf-8')
+            plaintext = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
         elif isinstance(data, str):
-            data_bytes = data.encode('utf-8')
+            plaintext = data if data.isascii() else data.encode('utf-8')
         else:
-            data_bytes = data
-        
-        # Generate a random AES-256 key (32 bytes = 256 bits)
-        aes_key = os.urandom(32)
+            plaintext = data
         
-        # Generate a random IV (16 bytes for AES)
-        iv = os.urandom(16)
+        if reuse_session:
+            session_id, aes_key, encrypted_aes_key = self._get_send_session(rsa_key_to_use)
+            
+            # Generate a random 96-bit nonce (the standard size for GCM)
+            iv = os.urandom(_GCM_NONCE_SIZE)
+        else:
+            # Draw the AES-256 key and the 96-bit GCM nonce in one call
+            key_and_iv = os.urandom(32 + _GCM_NONCE_SIZE)
+            aes_key = key_and_iv[:32]
+            iv = key_and_iv[32:]
+            
+            # Encrypt AES key with RSA
+            encrypted_aes_key = rsa_key_to_use.encrypt(
+                aes_key,
+                self._oaep
+            )
         
-        # Encrypt data with AES-256 in CBC mode
-        cipher = Cipher(
-            algorithms.AES(aes_key),
-            modes.CBC(iv),
-            backend=self.backend
-        )
-        encryptor = cipher.encryptor()
+        # Lay out the envelope up front and encrypt straight into it
+        key_field = encrypted_aes_key or session_id
+        nonce_start = _KEY_LEN.size + len(key_field)
+        tag_start = nonce_start + _GCM_NONCE_SIZE
+        data_start = tag_start + _GCM_TAG_SIZE
         
-        # Pad data to be multiple of block size (16 bytes for AES)
-        pad_length = 16 - (len(data_bytes) % 16)
-        padded_data = data_bytes + bytes([pad_length] * pad_length)
+        if not encrypted_aes_key:
+            key_len = 0
+        elif reuse_session:
+            key_len = len(encrypted_aes_key) | _SESSION_START_FLAG
+        else:
+            key_len = len(encrypted_aes_key)
         
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        envelope = bytearray(data_start + len(plaintext))
+        _KEY_LEN.pack_into(envelope, 0, key_len)
+        envelope[_KEY_LEN.size:nonce_start] = key_field
+        envelope[nonce_start:tag_start] = iv
         
-        # Encrypt AES key with RSA
-        encrypted_aes_key = rsa_key_to_use.encrypt(
-            aes_key,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
-            )
+        # Encrypt and authenticate data with AES-256 in GCM mode
+        envelope[tag_start:data_start] = _aes_gcm_encrypt_into(
+            aes_key, iv, plaintext, memoryview(envelope)[data_start:]
         )
-        
-        # Create result dictionary
-        result = {
-            "encrypted_key": base64.b64encode(encrypted_aes_key).decode('utf-8'),
-            "encrypted_data": base64.b64encode(encrypted_data).decode('utf-8'),
-            "iv": base64.b64encode(iv).decode('utf-8')
-        }
-        
-        # Return as JSON string
-        return json.dumps(result)
+        return b64encode(envelope).decode('ascii')
     
     def decrypt(
         self,
@@ -287,60 +426,39 @@ class RSAEncryptionHelper:
         Decrypt data using hybrid decryption (AES-256 + RSA).
         
         First decrypts the AES key with RSA, then decrypts the data with AES-256.
+        Accepts the binary envelope produced by encrypt() as well as the
+        older JSON payloads (AES-GCM with a tag field, or AES-CBC without).
         
         Args:
-            encrypted_data: JSON string containing encrypted_key, encrypted_data, and iv
+            encrypted_data: Base64 envelope from encrypt(), or a legacy JSON payload
             private_key: Private key to use (uses self.private_key if not provided)
             
         Returns:
             Decrypted data as bytes
         """
-        if not private_key and not self.private_key:
-            raise ValueError("No private key available for decryption")
-        
         rsa_key_to_use = private_key or self.private_key
+        if rsa_key_to_use is None:
+            raise ValueError("No private key available for decryption")
         
         try:
-            # Parse the encrypted data JSON
-            encrypted_dict = json.loads(encrypted_data)
-            
-            encrypted_key_b64 = encrypted_dict.get("encrypted_key")
-            encrypted_data_b64 = encrypted_dict.get("encrypted_data")
-            iv_b64 = encrypted_dict.get("iv")
-            
-            if not all([encrypted_key_b64, encrypted_data_b64, iv_b64]):
-                raise ValueError("Missing required fields in encrypted data")
-            
-            # Decode base64 values
-            encrypted_aes_key = base64.b64decode(encrypted_key_b64)
-            encrypted_data_bytes = base64.b64decode(encrypted_data_b64)
-            iv = base64.b64decode(iv_b64)
-            
-            # Decrypt AES key with RSA
-            aes_key = rsa_key_to_use.decrypt(
-                encrypted_aes_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
+            if encrypted_data.lstrip().startswith('{'):
+                encrypted_aes_key, iv, tag, ciphertext = self._parse_json_payload(encrypted_data)
+                
+                # Decrypt AES key with RSA
+                aes_key = rsa_key_to_use.decrypt(
+                    encrypted_aes_key,
+                    self._oaep
                 )
-            )
+            else:
+                key_len, key_field, iv, tag, ciphertext = self._parse_envelope(encrypted_data)
+                aes_key = self._get_recv_session_key(rsa_key_to_use, key_len, key_field)
             
             # Decrypt data with AES-256
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.CBC(iv),
-                backend=self.backend
-            )
-            decryptor = cipher.decryptor()
-            
-            padded_decrypted = decryptor.update(encrypted_data_bytes) + decryptor.finalize()
+            if tag:
+                return _aes_gcm_decrypt(aes_key, iv, ciphertext, tag)
             
-            # Remove padding
-            pad_length = padded_decrypted[-1]
-            decrypted = padded_decrypted[:-pad_length]
-            
-            return decrypted
+            # Payloads without a tag were encrypted with AES-CBC
+            return _unpad_pkcs7(_aes_cbc_decrypt(aes_key, iv, ciphertext))
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse encrypted data JSON: {e}")
             raise ValueError(f"Invalid encrypted data format: {e}")
@@ -348,6 +466,139 @@ class RSAEncryptionHelper:
             logger.error(f"Decryption failed: {e}")
             raise ValueError(f"Failed to decrypt data: {e}")
     
+    def _get_send_session(self, public_key: rsa.RSAPublicKey) -> tuple:
+        """
+        Get the AES session key for a recipient, starting a new session if needed.
+        
+        Args:
+            public_key: Recipient public key
+            
+        Returns:
+            Tuple of (session_id, aes_key, encrypted_aes_key), where
+            encrypted_aes_key is None once the recipient has been sent it
+        """
+        fingerprint = self._key_fingerprint(public_key)
+        
+        with self._cache_lock:
+            session = self._send_sessions.get(fingerprint)
+            if session is not None and session[2] < _SESSION_MAX_MESSAGES:
+                session[2] += 1
+                self._send_sessions.move_to_end(fingerprint)
+                return session[0], session[1], None
+        
+        aes_key = os.urandom(32)
+        encrypted_aes_key = public_key.encrypt(aes_key, self._oaep)
+        session_id = _session_id(encrypted_aes_key)
+        
+        with self._cache_lock:
+            self._send_sessions[fingerprint] = [session_id, aes_key, 1]
+            self._send_sessions.move_to_end(fingerprint)
+            if len(self._send_sessions) > _SESSION_CACHE_SIZE:
+                self._send_sessions.popitem(last=False)
+        return session_id, aes_key, encrypted_aes_key
+    
+    def _key_fingerprint(self, public_key: rsa.RSAPublicKey) -> bytes:
+        """SHA-256 of the recipient's DER public key, remembered for the last key seen."""
+        last_key, fingerprint = self._last_fingerprint
+        if public_key is not last_key:
+            fingerprint = hashlib.sha256(
+                public_key.public_bytes(
+                    encoding=serialization.Encoding.DER,
+                    format=serialization.PublicFormat.SubjectPublicKeyInfo
+                )
+            ).digest()
+            self._last_fingerprint = (public_key, fingerprint)
+        return fingerprint
+    
+    def _get_recv_session_key(
+        self,
+        private_key: rsa.RSAPrivateKey,
+        key_len: int,
+        key_field: bytes
+    ) -> bytes:
+        """
+        Resolve the AES key of a received envelope.
+        
+        Only envelopes flagged as starting a session have their key kept,
+        so ordinary traffic doesn't evict live sessions from the cache.
+        
+        Args:
+            private_key: Private key used to unwrap new AES keys
+            key_len: Raw key length field of the envelope header
+            key_field: RSA-encrypted AES key, or the session id when key_len is 0
+            
+        Returns:
+            AES key
+        """
+        if key_len == 0:
+            session_id = bytes(key_field)
+            with self._cache_lock:
+                aes_key = self._recv_sessions.get(session_id)
+                if aes_key is None:
+                    raise ValueError("Unknown encryption session")
+                self._recv_sessions.move_to_end(session_id)
+            return aes_key
+        
+        aes_key = private_key.decrypt(key_field, self._oaep)
+        
+        if key_len & _SESSION_START_FLAG:
+            with self._cache_lock:
+                self._recv_sessions[_session_id(key_field)] = aes_key
+                if len(self._recv_sessions) > _SESSION_CACHE_SIZE:
+                    self._recv_sessions.popitem(last=False)
+        return aes_key
+    
+    @staticmethod
+    def _parse_envelope(encrypted_data: str) -> tuple:
+        """
+        Split a base64 binary envelope into key length field, key, nonce,
+        tag and ciphertext.
+        
+        The key is the RSA-encrypted AES key, or the session id when the
+        envelope reuses a session key (key length field 0).
+        """
+        blob = memoryview(b64decode(encrypted_data, validate=True))
+        (key_len,) = _KEY_LEN.unpack_from(blob, 0)
+        if key_len == 0:
+            key_start, key_end = _KEY_LEN.size, _KEY_LEN.size + _SESSION_ID_SIZE
+        else:
+            key_start, key_end = _KEY_LEN.size, _KEY_LEN.size + (key_len & ~_SESSION_START_FLAG)
+        
+        nonce_end = key_end + _GCM_NONCE_SIZE
+        tag_end = nonce_end + _GCM_TAG_SIZE
+        if len(blob) < tag_end:
+            raise ValueError("Truncated encrypted data")
+        
+        return (
+            key_len,
+            bytes(blob[key_start:key_end]),
+            bytes(blob[key_end:nonce_end]),
+            bytes(blob[nonce_end:tag_end]),
+            blob[tag_end:]
+        )
+    
+    @staticmethod
+    def _parse_json_payload(encrypted_data: str) -> tuple:
+        """Split a legacy JSON payload into key, iv, tag (or None) and ciphertext."""
+        encrypted_dict = orjson.loads(encrypted_data)
+        
+        try:
+            encrypted_key_b64, encrypted_data_b64, iv_b64 = (
+                encrypted_dict["encrypted_key"],
+                encrypted_dict["encrypted_data"],
+                encrypted_dict["iv"]
+            )
+        except KeyError:
+            raise ValueError("Missing required fields in encrypted data")
+        tag_b64 = encrypted_dict.get("tag")
+        
+        return (
+            b64decode(encrypted_key_b64),
+            b64decode(iv_b64),
+            b64decode(tag_b64) if tag_b64 else None,
+            b64decode(encrypted_data_b64)
+        )
+    
     def decrypt_json(
         self,
         encrypted_data: str,
@@ -357,14 +608,14 @@ class RSAEncryptionHelper:
         Decrypt and parse JSON data.
         
         Args:
-            encrypted_data: JSON string containing encrypted_key, encrypted_data, and iv
+            encrypted_data: Encrypted payload produced by encrypt()
             private_key: Private key to use (uses self.private_key if not provided)
             
         Returns:
             Decrypted JSON data as dictionary
         """
         decrypted_bytes = self.decrypt(encrypted_data, private_key)
-        return json.loads(decrypted_bytes.decode('utf-8'))
+        return orjson.loads(decrypted_bytes)
     
     def decrypt_string(
         self,
@@ -375,7 +626,7 @@ class RSAEncryptionHelper:
         Decrypt data to string.
         
         Args:
-            encrypted_data: JSON string containing encrypted_key, encrypted_data, and iv
+            encrypted_data: Encrypted payload produced by encrypt()
             private_key: Private key to use (uses self.private_key if not provided)
             
         Returns:
@@ -387,7 +638,9 @@ class RSAEncryptionHelper:
     def encrypt_api_response(
         self,
         response_data: Dict[str, Any],
-        public_key: Optional[rsa.RSAPublicKey] = None
+        public_key: Optional[rsa.RSAPublicKey] = None,
+        reuse_session: bool = False,
+        cache_ok: bool = False
     ) -> Dict[str, Any]:
         """
         Encrypt API response data using hybrid encryption (AES-256 + RSA).
@@ -395,16 +648,24 @@ class RSAEncryptionHelper:
         Args:
             response_data: API response dictionary to encrypt
             public_key: Public key to use (uses self.public_key if not provided)
+            reuse_session: Reuse a per-recipient AES session key (see encrypt)
+            cache_ok: Return the same envelope for an identical response to the
+                same recipient instead of encrypting again. Identical responses
+                then produce identical ciphertexts, so only enable it for
+                endpoints where that (and replay) is acceptable.
             
         Returns:
             Dictionary with encrypted data
         """
         try:
-            encrypted = self.encrypt(response_data, public_key)
+            if cache_ok:
+                encrypted = self._encrypt_cached(response_data, public_key, reuse_session)
+            else:
+                encrypted = self.encrypt(response_data, public_key, reuse_session)
             return {
                 "encrypted": True,
                 "data": encrypted,
-                "algorithm": "AES256-RSA-OAEP-SHA256"
+                "algorithm": "AES256-GCM-RSA-OAEP-SHA256"
             }
         except ValueError as e:
             logger.error(f"Failed to encrypt API response: {e}")
@@ -414,6 +675,36 @@ class RSAEncryptionHelper:
                 "data": response_data  # Return unencrypted as fallback
             }
     
+    def _encrypt_cached(
+        self,
+        response_data: Dict[str, Any],
+        public_key: Optional[rsa.RSAPublicKey],
+        reuse_session: bool
+    ) -> str:
+        """Encrypt a response, reusing the envelope of an identical earlier one."""
+        rsa_key_to_use = public_key or self.public_key
+        if rsa_key_to_use is None:
+            raise ValueError("No public key available for encryption")
+        
+        payload = orjson.dumps(response_data, option=orjson.OPT_NON_STR_KEYS)
+        digest = hashlib.blake2b(payload, digest_size=16)
+        digest.update(self._key_fingerprint(rsa_key_to_use))
+        digest.update(b"\x01" if reuse_session else b"\x00")
+        cache_key = digest.digest()
+        
+        with self._cache_lock:
+            encrypted = self._response_cache.get(cache_key)
+            if encrypted is not None:
+                self._response_cache.move_to_end(cache_key)
+                return encrypted
+        
+        encrypted = self.encrypt(payload, rsa_key_to_use, reuse_session)
+        with self._cache_lock:
+            self._response_cache[cache_key] = encrypted
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return encrypted
+    
     def decrypt_api_response(
         self,
         encrypted_response: Dict[str, Any],
@@ -441,6 +732,47 @@ class RSAEncryptionHelper:
         except Exception as e:
             logger.error(f"Failed to decrypt API response: {e}")
             raise ValueError(f"Failed to decrypt API response: {e}")
+    
+    async def encrypt_api_response_async(
+        self,
+        response_data: Dict[str, Any],
+        public_key: Optional[rsa.RSAPublicKey] = None,
+        reuse_session: bool = False,
+        cache_ok: bool = False
+    ) -> Dict[str, Any]:
+        """
+        encrypt_api_response() run in the default executor, so the RSA and
+        AES work doesn't block the event loop.
+        
+        Args:
+            response_data: API response dictionary to encrypt
+            public_key: Public key to use (uses self.public_key if not provided)
+            reuse_session: Reuse a per-recipient AES session key (see encrypt)
+            cache_ok: Allow reusing the envelope of an identical response
+            
+        Returns:
+            Dictionary with encrypted data
+        """
+        return await asyncio.to_thread(
+            self.encrypt_api_response, response_data, public_key, reuse_session, cache_ok
+        )
+    
+    async def decrypt_api_response_async(
+        self,
+        encrypted_response: Dict[str, Any],
+        private_key: Optional[rsa.RSAPrivateKey] = None
+    ) -> Dict[str, Any]:
+        """
+        decrypt_api_response() run in the default executor.
+        
+        Args:
+            encrypted_response: Encrypted response dictionary
+            private_key: Private key to use (uses self.private_key if not provided)
+            
+        Returns:
+            Decrypted API response dictionary
+        """
+        return await asyncio.to_thread(self.decrypt_api_response, encrypted_response, private_key)
 
 
 # Global instance - can be initialized with keys from settings or environment
@@ -455,5 +787,18 @@ def _initialize_rsa_helper() -> RSAEncryptionHelper:
     )
 
 
-# Global RSA encryption helper instance
-rsa_encryption_helper = _initialize_rsa_helper()
+# Global RSA encryption helper instance, created on first access so that
+# importing this module never pays for RSA key generation
+_rsa_helper: Optional[RSAEncryptionHelper] = None
+_rsa_helper_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    global _rsa_helper
+    if name == "rsa_encryption_helper":
+        if _rsa_helper is None:
+            with _rsa_helper_lock:
+                if _rsa_helper is None:
+                    _rsa_helper = _initialize_rsa_helper()
+        return _rsa_helper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
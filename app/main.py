@@ -7,13 +7,16 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.config.settings import settings
 from app.config.database import db_config
 from app.config.redis_config import redis_config
+from app.config.rate_limit import limiter
+from app.helpers.cache_helper import cache_helper
+from app.helpers.openai_helper import shared_http_client
 from app.routes import chat, health, auth
 
 # Configure logging
@@ -23,9 +26,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -42,6 +42,7 @@ async def lifespan(app: FastAPI):
         
         # Initialize Redis connection
         await redis_config.connect()
+        cache_helper._client = redis_config.redis
         logger.info("Redis connection established")
         
     except Exception as e:
@@ -59,9 +60,14 @@ async def lifespan(app: FastAPI):
         logger.info("Database connection closed")
         
         # Close Redis connection
+        cache_helper._client = None
         await redis_config.disconnect()
         logger.info("Redis connection closed")
         
+        # Close the shared OpenAI HTTP pool
+        await shared_http_client.aclose()
+        logger.info("OpenAI HTTP client closed")
+        
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -72,6 +78,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter state and exception handler
@@ -105,4 +112,12 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.WORKERS,
+        access_log=settings.DEBUG,
+    )
\ No newline at end of file
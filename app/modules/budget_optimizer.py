@@ -1,20 +1,136 @@
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from app.helpers.openai_helper import ItineraryOutput, MultipleItinerariesOutput
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+_BUDGET_RE = re.compile(r"(\d+(?:\.\d+)?)")
+# Nightly rate assumed for itineraries without hotel recommendations
+_DEFAULT_HOTEL_PRICE = 3000
+
+if njit is not None:
+    @njit(cache=True)
+    def _batch_costs(prices, offsets, days, nights, daily_cost):
+        """Per-itinerary min hotel price * nights + daily cost * days, in one compiled loop."""
+        n = offsets.shape[0] - 1
+        out = np.empty(n)
+        for i in range(n):
+            cheapest = prices[offsets[i]]
+            for j in range(offsets[i] + 1, offsets[i + 1]):
+                if prices[j] < cheapest:
+                    cheapest = prices[j]
+            out[i] = cheapest * nights + daily_cost * days[i]
+        return out
+else:
+    _batch_costs = None
+
 
 def parse_budget(budget_str: Optional[str]) -> Optional[float]:
     """Parse budget string like '₹20000' to numeric value."""
     if not budget_str:
         return None
     
+    if isinstance(budget_str, (int, float)):
+        return float(budget_str)
+    
+    if not isinstance(budget_str, str):
+        budget_str = str(budget_str)
+    elif budget_str.isascii() and budget_str.isdigit():
+        return float(budget_str)
+    
     # Extract numeric value from string like "₹20000" or "20000"
-    match = re.search(r"(\d+(?:\.\d+)?)", str(budget_str))
+    match = _BUDGET_RE.search(budget_str)
     if match:
         return float(match.group(1))
     return None
 
 
+def _itinerary_cost_array(
+    itineraries: Sequence[ItineraryOutput],
+    duration_days: Optional[int],
+    daily_cost: float
+) -> np.ndarray:
+    """Total estimated cost of each itinerary as a float64 array."""
+    if not itineraries:
+        return np.empty(0)
+    
+    # Number of nights = duration_days - 1 (or duration_days if same day return)
+    nights = duration_days - 1 if duration_days and duration_days > 1 else 1
+    
+    # Flatten every hotel price into one array; an itinerary without hotels
+    # contributes the default price so no segment is empty
+    hotel_counts = np.fromiter(
+        (len(itinerary.hotels) or 1 for itinerary in itineraries),
+        dtype=np.intp,
+        count=len(itineraries)
+    )
+    prices = np.fromiter(
+        (
+            price
+            for itinerary in itineraries
+            for price in (
+                [hotel.price_per_night for hotel in itinerary.hotels]
+                or [_DEFAULT_HOTEL_PRICE]
+            )
+        ),
+        dtype=np.float64,
+        count=int(hotel_counts.sum())
+    )
+    offsets = np.zeros(len(itineraries) + 1, dtype=np.intp)
+    np.cumsum(hotel_counts, out=offsets[1:])
+    
+    # Calculate daily costs (food, activities, transport)
+    if duration_days:
+        days = np.full(len(itineraries), duration_days, dtype=np.float64)
+    else:
+        days = np.fromiter(
+            (len(itinerary.day_plans) for itinerary in itineraries),
+            dtype=np.float64,
+            count=len(itineraries)
+        )
+    
+    if _batch_costs is not None:
+        return _batch_costs(prices, offsets, days, float(nights), float(daily_cost))
+    
+    # Use the cheapest hotel price per itinerary
+    min_prices = np.minimum.reduceat(prices, offsets[:-1])
+    return min_prices * nights + daily_cost * days
+
+
+def calculate_itinerary_costs(
+    itineraries: Sequence[ItineraryOutput],
+    duration_days: Optional[int],
+    daily_food_cost: float = 2000.0,
+    daily_activity_cost: float = 1500.0,
+    daily_transport_cost: float = 500.0
+) -> List[float]:
+    """
+    Calculate total estimated cost for a batch of itineraries.
+    
+    Args:
+        itineraries: The itineraries to calculate costs for
+        duration_days: Number of days for the trip
+        daily_food_cost: Estimated daily food cost per person (default: ₹2000)
+        daily_activity_cost: Estimated daily activity/entertainment cost (default: ₹1500)
+        daily_transport_cost: Estimated daily transport cost (default: ₹500)
+    
+    Returns:
+        Total estimated cost in rupees for each itinerary, in order
+    """
+    return _itinerary_cost_array(
+        itineraries,
+        duration_days,
+        daily_food_cost + daily_activity_cost + daily_transport_cost
+    ).tolist()
+
+
 def calculate_itinerary_cost(
     itinerary: ItineraryOutput,
     duration_days: Optional[int],
@@ -35,25 +151,45 @@ def calculate_itinerary_cost(
     Returns:
         Total estimated cost in rupees
     """
-    total_cost = 0.0
-    
-    # Calculate hotel cost (use cheapest hotel or first hotel if available)
-    if itinerary.hotels:
-        # Use the cheapest hotel price
-        cheapest_hotel_price = min(hotel.price_per_night for hotel in itinerary.hotels)
-        # Number of nights = duration_days - 1 (or duration_days if same day return)
-        nights = duration_days - 1 if duration_days and duration_days > 1 else 1
-        total_cost += cheapest_hotel_price * nights
-    else:
-        # Default hotel cost if no hotels provided
-        nights = duration_days - 1 if duration_days and duration_days > 1 else 1
-        total_cost += 3000 * nights  # Default ₹3000 per night
+    return calculate_itinerary_costs(
+        [itinerary],
+        duration_days,
+        daily_food_cost,
+        daily_activity_cost,
+        daily_transport_cost
+    )[0]
+
+
+def _select_best_with_cost(
+    itineraries: Sequence[ItineraryOutput],
+    budget_value: Optional[float],
+    duration_days: Optional[int],
+    daily_food_cost: float,
+    daily_activity_cost: float,
+    daily_transport_cost: float
+) -> Tuple[ItineraryOutput, bool, float]:
+    """Pick the best itinerary for an already parsed budget and return its cost too."""
+    if not itineraries:
+        raise ValueError("No itineraries provided")
     
-    # Calculate daily costs (food, activities, transport)
-    days = duration_days if duration_days else len(itinerary.day_plans)
-    total_cost += (daily_food_cost + daily_activity_cost + daily_transport_cost) * days
+    # Calculate cost for each itinerary
+    costs = _itinerary_cost_array(
+        itineraries,
+        duration_days,
+        daily_food_cost + daily_activity_cost + daily_transport_cost
+    )
     
-    return total_cost
+    if budget_value is not None:
+        within_budget = costs <= budget_value
+        if within_budget.any():
+            # Select the one closest to budget (most value for money)
+            # Prefer the one with highest cost that's still within budget
+            idx = int(np.argmax(np.where(within_budget, costs, -np.inf)))
+            return itineraries[idx], True, float(costs[idx])
+    
+    # No budget specified, or no itinerary fits within it: return the cheapest one
+    idx = int(np.argmin(costs))
+    return itineraries[idx], False, float(costs[idx])
 
 
 def select_best_itinerary_for_budget(
@@ -80,44 +216,15 @@ def select_best_itinerary_for_budget(
         - selected_itinerary: The itinerary that best fits the budget
         - best_for_budget: True if the selected itinerary fits within budget, False otherwise
     """
-    if not multiple_itineraries.itineraries:
-        raise ValueError("No itineraries provided")
-    
-    # Parse budget to numeric value
-    budget_value = parse_budget(budget)
-    
-    # Calculate cost for each itinerary
-    itinerary_costs = []
-    for itinerary in multiple_itineraries.itineraries:
-        cost = calculate_itinerary_cost(
-            itinerary,
-            duration_days,
-            daily_food_cost,
-            daily_activity_cost,
-            daily_transport_cost
-        )
-        itinerary_costs.append((itinerary, cost))
-    
-    # If no budget specified, return the cheapest itinerary
-    if budget_value is None:
-        cheapest = min(itinerary_costs, key=lambda x: x[1])
-        return cheapest[0], False
-    
-    # Filter itineraries that fit within budget
-    within_budget = [
-        (itinerary, cost) for itinerary, cost in itinerary_costs
-        if cost <= budget_value
-    ]
-    
-    if within_budget:
-        # Select the one closest to budget (most value for money)
-        # Prefer the one with highest cost that's still within budget
-        best_itinerary, best_cost = max(within_budget, key=lambda x: x[1])
-        return best_itinerary, True
-    else:
-        # No itinerary fits within budget, return the cheapest one
-        cheapest = min(itinerary_costs, key=lambda x: x[1])
-        return cheapest[0], False
+    selected_itinerary, best_for_budget, _ = _select_best_with_cost(
+        multiple_itineraries.itineraries,
+        parse_budget(budget),
+        duration_days,
+        daily_food_cost,
+        daily_activity_cost,
+        daily_transport_cost
+    )
+    return selected_itinerary, best_for_budget
 
 
 def optimize_budget(
@@ -145,21 +252,12 @@ def optimize_budget(
         - estimated_cost: Total estimated cost of the selected itinerary
         - budget: The user's budget (if provided)
     """
-    budget = nlp_data.get("budget")
-    duration_days = nlp_data.get("duration_days")
-    
-    selected_itinerary, best_for_budget = select_best_itinerary_for_budget(
-        multiple_itineraries,
-        budget,
-        duration_days,
-        daily_food_cost,
-        daily_activity_cost,
-        daily_transport_cost
-    )
+    budget_value = parse_budget(nlp_data.get("budget"))
     
-    estimated_cost = calculate_itinerary_cost(
-        selected_itinerary,
-        duration_days,
+    selected_itinerary, best_for_budget, estimated_cost = _select_best_with_cost(
+        multiple_itineraries.itineraries,
+        budget_value,
+        nlp_data.get("duration_days"),
         daily_food_cost,
         daily_activity_cost,
         daily_transport_cost
@@ -169,7 +267,7 @@ def optimize_budget(
         "itinerary": selected_itinerary,
         "best_for_budget": best_for_budget,
         "estimated_cost": estimated_cost,
-        "budget": parse_budget(budget)
+        "budget": budget_value
     }
 
 
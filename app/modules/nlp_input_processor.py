@@ -1,28 +1,61 @@
+import asyncio
 import os
 import re
 import torch
 import requests
+from requests.adapters import HTTPAdapter
 import spacy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from sentence_transformers import SentenceTransformer, util
 from dateparser import parse as date_parse
 from app.config.settings import settings
 
 
 nlp = spacy.load("en_core_web_sm")
+# Each extractor runs only the spaCy components it reads from. They are
+# disabled per call rather than with select_pipes, which mutates the shared
+# pipeline and would race when extractors run on worker threads
+_NER_DISABLE = [name for name in nlp.pipe_names if name not in ("tok2vec", "ner")]
+_LEMMA_DISABLE = [
+    name for name in nlp.pipe_names
+    if name not in ("tok2vec", "tagger", "attribute_ruler", "lemmatizer")
+]
+# Applied on top of an NER doc, whose tok2vec output the tagger and parser reuse
+_NOUN_CHUNK_PIPES = ["tagger", "attribute_ruler", "parser"]
 GOOGLE_PLACES_API_KEY = settings.GOOGLE_PLACES_API_KEY
 
+# Keep-alive connections to the Places API, shared across lookups
+_places_session = requests.Session()
+_places_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+_BUDGET_RE = re.compile(r"(\d+(?:\.\d+)?)\s?(k|thousand|lakh|rs|inr|₹|hajar)?", re.IGNORECASE)
+_DURATION_RE = re.compile(r"(\d+)\s*(day|days|week|weeks)", re.IGNORECASE)
+
 embedder_main = SentenceTransformer("all-MiniLM-L6-v2")
 embedder_e5 = SentenceTransformer("intfloat/e5-base-v2")
 
+# Fixed reference that destination candidates are ranked against; embedded once
+DESTINATION_REF_EMB = embedder_main.encode(
+    "travel destination or tourist location", convert_to_tensor=True
+)
+
+
+
+# Runs the two encoders side by side; torch releases the GIL while encoding
+_encode_pool = ThreadPoolExecutor(max_workers=2)
 
 
+@lru_cache(maxsize=1024)
 def combine_embeddings(text: str):
-    e1 = embedder_main.encode(text, convert_to_tensor=True, normalize_embeddings=True)
-    e2 = embedder_e5.encode(text, convert_to_tensor=True, normalize_embeddings=True)
-    return torch.cat([e1, e2])
+    """Concatenated MiniLM + E5 embedding of text; cached per string, treat as read-only."""
+    f1 = _encode_pool.submit(embedder_main.encode, text, convert_to_tensor=True, normalize_embeddings=True)
+    f2 = _encode_pool.submit(embedder_e5.encode, text, convert_to_tensor=True, normalize_embeddings=True)
+    return torch.cat([f1.result(), f2.result()])
 
 
+@lru_cache(maxsize=2048)
 def get_place_from_google(query: str):
     """Return only the main city/place name from Google Places Autocomplete."""
     query = query.strip()
@@ -35,7 +68,7 @@ def get_place_from_google(query: str):
         "key": GOOGLE_PLACES_API_KEY,
         "types": "(cities)"  # restrict to cities
     }
-    resp = requests.get(url_auto, params=params).json()
+    resp = _places_session.get(url_auto, params=params).json()
     preds = resp.get("predictions", [])
 
     if preds:
@@ -47,11 +80,15 @@ def get_place_from_google(query: str):
 
 def extract_destination(user_input: str):
     """Dynamic hybrid destination extractor using NLP + embeddings + Google Places."""
-    doc = nlp(user_input)
+    doc = nlp(user_input, disable=_NER_DISABLE)
 
     candidates = [ent.text.strip() for ent in doc.ents if ent.label_ in ["GPE", "LOC", "FACILITY", "ORG"]]
 
     if not candidates:
+        # Noun chunks need the tagger and parser, so only run them as a
+        # fallback, on the same doc rather than re-tokenizing
+        for name in _NOUN_CHUNK_PIPES:
+            doc = nlp.get_pipe(name)(doc)
         for chunk in doc.noun_chunks:
             if any(tok.pos_ == "PROPN" for tok in chunk):
                 candidates.append(chunk.text.strip())
@@ -59,9 +96,8 @@ def extract_destination(user_input: str):
     if not candidates:
         return None
 
-    ref_vec = embedder_main.encode("travel destination or tourist location", convert_to_tensor=True)
     cand_vecs = embedder_main.encode(candidates, convert_to_tensor=True)
-    sims = util.cos_sim(ref_vec, cand_vecs)[0]
+    sims = util.cos_sim(DESTINATION_REF_EMB, cand_vecs)[0]
     top_candidate = candidates[int(torch.argmax(sims))]
 
     place = get_place_from_google(top_candidate)
@@ -70,11 +106,10 @@ def extract_destination(user_input: str):
 
 def extract_budget(user_input: str):
     """Handle patterns like 20k, 20000rs, 1 lakh, hajar, thousand etc."""
-    text = user_input.lower()
-    match = re.search(r"(\d+(?:\.\d+)?)\s?(k|thousand|lakh|rs|inr|₹|hajar)?", text)
+    match = _BUDGET_RE.search(user_input)
     if match:
         num = float(match.group(1))
-        unit = match.group(2) or ""
+        unit = (match.group(2) or "").lower()
         if "lakh" in unit:
             num *= 100000
         elif "k" in unit or "thousand" in unit:
@@ -87,10 +122,10 @@ def extract_duration_and_dates(user_input: str):
     duration_days = None
     dates = None
 
-    dur = re.search(r"(\d+)\s*(day|days|week|weeks)", user_input.lower())
+    dur = _DURATION_RE.search(user_input)
     if dur:
         num = int(dur.group(1))
-        unit = dur.group(2)
+        unit = dur.group(2).lower()
         duration_days = num * 7 if "week" in unit else num
 
     parsed_date = date_parse(user_input, settings={"PREFER_DATES_FROM": "future"})
@@ -100,39 +135,58 @@ def extract_duration_and_dates(user_input: str):
     return duration_days, dates
 
 
+TRIP_TYPES = [
+    "honeymoon", "family", "solo", "friends", "adventure", "relaxing",
+    "cultural", "luxury", "budget", "romantic", "business"
+]
+# Label embeddings never change, so they are computed once at import and
+# L2-normalized so a plain mat-vec gives cosine similarity. They stay on the
+# embedder's device; on GPU they are kept in FP16 to halve memory traffic
+TRIP_TYPE_EMB = torch.nn.functional.normalize(
+    torch.stack([combine_embeddings(t) for t in TRIP_TYPES]), dim=1
+)
+if TRIP_TYPE_EMB.is_cuda:
+    TRIP_TYPE_EMB = TRIP_TYPE_EMB.half()
+
+
 def classify_trip_type(user_input: str):
-    trip_types = [
-        "honeymoon", "family", "solo", "friends", "adventure", "relaxing",
-        "cultural", "luxury", "budget", "romantic", "business"
-    ]
-    sims = util.cos_sim(
-        combine_embeddings(user_input),
-        torch.stack([combine_embeddings(t) for t in trip_types])
-    )[0]
-    return trip_types[int(torch.argmax(sims))]
+    query = torch.nn.functional.normalize(combine_embeddings(user_input), dim=0)
+    sims = TRIP_TYPE_EMB @ query.to(TRIP_TYPE_EMB.dtype)
+    return TRIP_TYPES[int(torch.argmax(sims))]
+
+
+PREF_KEYWORDS = frozenset({
+    "beach", "mountain", "trek", "museum", "shopping", "scuba", "food",
+    "adventure", "temple", "heritage", "nightlife", "wildlife",
+    "relax", "party", "luxury", "cultural", "nature", "history"
+})
 
 
 def extract_preferences(user_input: str):
-    doc = nlp(user_input.lower())
-    pref_keywords = [
-        "beach", "mountain", "trek", "museum", "shopping", "scuba", "food",
-        "adventure", "temple", "heritage", "nightlife", "wildlife",
-        "relax", "party", "luxury", "cultural", "nature", "history"
-    ]
-    prefs = []
+    doc = nlp(user_input.lower(), disable=_LEMMA_DISABLE)
+    # Insertion-ordered dict: keeps first-seen order with O(1) duplicate checks
+    prefs = {}
     for token in doc:
-        if token.lemma_ in pref_keywords and token.lemma_ not in prefs:
-            prefs.append(token.lemma_)
-    return prefs
+        lemma = token.lemma_
+        if lemma in PREF_KEYWORDS:
+            prefs[lemma] = None
+    return list(prefs)
+
 
+async def parse_user_input(user_input: str):
+    """Unified entrypoint for NLP-NPU preprocessing.
 
-def parse_user_input(user_input: str):
-    """Unified entrypoint for NLP-NPU preprocessing."""
-    destination = extract_destination(user_input)
+    The heavy extractors run concurrently in worker threads, so the Google
+    Places call overlaps with spaCy and transformer inference and the event
+    loop stays free.
+    """
     budget = extract_budget(user_input)
-    duration_days, dates = extract_duration_and_dates(user_input)
-    trip_type = classify_trip_type(user_input)
-    preferences = extract_preferences(user_input)
+    destination, (duration_days, dates), trip_type, preferences = await asyncio.gather(
+        asyncio.to_thread(extract_destination, user_input),
+        asyncio.to_thread(extract_duration_and_dates, user_input),
+        asyncio.to_thread(classify_trip_type, user_input),
+        asyncio.to_thread(extract_preferences, user_input),
+    )
 
     return {
         "destination": destination,
@@ -146,4 +200,4 @@ def parse_user_input(user_input: str):
 
 if __name__ == "__main__":
     user_text = "Plan a short family trip to ahmedabad next weekend under 25k."
-    print(parse_user_input(user_text))
+    print(asyncio.run(parse_user_input(user_text)))
@@ -1,5 +1,5 @@
 import aiohttp
-import json
+import orjson
 from app.config.settings import settings
 
 FOURSQUARE_API_KEY = settings.FOURSQUARE_API_KEY
@@ -20,7 +20,7 @@ async def fetch_foursquare(session, lat, lng):
     }
     
     async with session.get(url, headers=headers, params=params) as resp:
-        data = await resp.json()
+        data = orjson.loads(await resp.read())
         
         results = data.get("results", [])
         pois = []
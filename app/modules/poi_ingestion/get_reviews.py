@@ -1,14 +1,34 @@
 import sys
 sys.path.append("/home/dhruv/workspace/izh")
+import asyncio
 import logging
 import aiohttp
+import numpy as np
 from typing import List, Dict, Any, Optional
 from app.helpers.db_executor import query_executor
-from app.modules.poi_ingestion.sentiment_analysis import analyze_sentiment
+from app.modules.poi_ingestion.sentiment_analysis import analyze_sentiment_batch
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Insert or update review (using ON CONFLICT to handle duplicates). Kept as
+# one constant so every batch hits the connection's prepared-statement cache
+_INSERT_REVIEW_SQL = """
+    INSERT INTO poi_reviews (
+        poi_id, author_name, author_url, language,
+        profile_photo_url, rating, relative_time_description,
+        text, time, sentiment_score
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT (poi_id, author_name, time) DO UPDATE SET
+        author_url = EXCLUDED.author_url,
+        language = EXCLUDED.language,
+        profile_photo_url = EXCLUDED.profile_photo_url,
+        rating = EXCLUDED.rating,
+        relative_time_description = EXCLUDED.relative_time_description,
+        text = EXCLUDED.text,
+        sentiment_score = EXCLUDED.sentiment_score
+"""
+
 
 async def store_reviews(poi_id: int, reviews: List[Dict[str, Any]]) -> int:
     """
@@ -25,64 +45,51 @@ async def store_reviews(poi_id: int, reviews: List[Dict[str, Any]]) -> int:
         logger.debug(f"No reviews to store for POI ID {poi_id}")
         return 0
     
-    stored_count = 0
-    
+    # Skip if essential fields are missing
+    valid_reviews = []
     for review in reviews:
+        if not review.get("author_name") or not review.get("text"):
+            logger.warning(f"Skipping review for POI {poi_id}: missing author_name or text")
+            continue
+        valid_reviews.append(review)
+    
+    # Analyze sentiment for all review texts at once, off the event loop
+    sentiment_scores = await asyncio.to_thread(
+        analyze_sentiment_batch, [review["text"] for review in valid_reviews]
+    )
+    
+    rows = [
+        (
+            poi_id,
+            review["author_name"],
+            review.get("author_url"),
+            review.get("language"),
+            review.get("profile_photo_url"),
+            review.get("rating"),
+            review.get("relative_time_description"),
+            review["text"],
+            review.get("time"),
+            sentiment_score
+        )
+        for review, sentiment_score in zip(valid_reviews, sentiment_scores)
+    ]
+    
+    stored_count = 0
+    if rows:
         try:
-            # Extract review fields (handle optional fields)
-            author_name = review.get("author_name")
-            author_url = review.get("author_url")
-            language = review.get("language")
-            profile_photo_url = review.get("profile_photo_url")
-            rating = review.get("rating")
-            relative_time_description = review.get("relative_time_description")
-            text = review.get("text")
-            time = review.get("time")
-            
-            # Skip if essential fields are missing
-            if not author_name or not text:
-                logger.warning(f"Skipping review for POI {poi_id}: missing author_name or text")
-                continue
-            
-            # Analyze sentiment for the review text
-            sentiment_score = analyze_sentiment(text)
-            
-            # Insert or update review (using ON CONFLICT to handle duplicates)
-            insert_query = """
-                INSERT INTO poi_reviews (
-                    poi_id, author_name, author_url, language,
-                    profile_photo_url, rating, relative_time_description,
-                    text, time, sentiment_score
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (poi_id, author_name, time) DO UPDATE SET
-                    author_url = EXCLUDED.author_url,
-                    language = EXCLUDED.language,
-                    profile_photo_url = EXCLUDED.profile_photo_url,
-                    rating = EXCLUDED.rating,
-                    relative_time_description = EXCLUDED.relative_time_description,
-                    text = EXCLUDED.text,
-                    sentiment_score = EXCLUDED.sentiment_score
-            """
-            
-            await query_executor.execute(
-                insert_query,
-                poi_id,
-                author_name,
-                author_url,
-                language,
-                profile_photo_url,
-                rating,
-                relative_time_description,
-                text,
-                time,
-                sentiment_score
-            )
-            
-            stored_count += 1
-            
+            # One pipelined round-trip for the whole batch
+            await query_executor.execute_many(_INSERT_REVIEW_SQL, rows)
+            stored_count = len(rows)
         except Exception as e:
-            logger.error(f"Error storing review for POI {poi_id}: {e}")
-            continue
+            # executemany is atomic, so one bad row rejects the batch; retry
+            # row by row to store the rest and log the failures individually
+            logger.warning(f"Batch insert failed for POI {poi_id}, retrying per review: {e}")
+            for row in rows:
+                try:
+                    await query_executor.execute(_INSERT_REVIEW_SQL, *row)
+                    stored_count += 1
+                except Exception as e:
+                    logger.error(f"Error storing review for POI {poi_id}: {e}")
     
     logger.info(f"Stored {stored_count} reviews for POI ID {poi_id}")
     return stored_count
@@ -108,14 +115,14 @@ async def get_reviews_by_poi_id(poi_id: int) -> List[Dict[str, Any]]:
         ORDER BY time DESC, rating DESC
     """
     
-    reviews = await query_executor.fetch_all(query, poi_id)
+    reviews = await query_executor.fetch_all(query, poi_id, as_dict=True)
     return reviews
 
 
 async def get_reviews_by_source_id(source: str, source_id: str) -> List[Dict[str, Any]]:
     """
     Retrieve all reviews for a POI by source and source_id.
-    First finds the POI, then retrieves its reviews.
+    Joins through pois in one query; an unknown POI yields no rows.
     
     Args:
         source: The source of the POI (e.g., 'google')
@@ -124,15 +131,18 @@ async def get_reviews_by_source_id(source: str, source_id: str) -> List[Dict[str
     Returns:
         List of review dictionaries
     """
-    # First, get the POI ID
-    poi_query = "SELECT id FROM pois WHERE source = $1 AND source_id = $2"
-    poi = await query_executor.fetch_one(poi_query, source, source_id)
-    
-    if not poi:
-        logger.warning(f"POI not found for source={source}, source_id={source_id}")
-        return []
+    query = """
+        SELECT 
+            r.id, r.poi_id, r.author_name, r.author_url, r.language,
+            r.profile_photo_url, r.rating, r.relative_time_description,
+            r.text, r.time, r.sentiment_score, r.created_at
+        FROM poi_reviews r
+        JOIN pois p ON r.poi_id = p.id
+        WHERE p.source = $1 AND p.source_id = $2
+        ORDER BY r.time DESC, r.rating DESC
+    """
     
-    return await get_reviews_by_poi_id(poi["id"])
+    return await query_executor.fetch_all(query, source, source_id, as_dict=True)
 
 
 async def fetch_tripadvisor_reviews(session: aiohttp.ClientSession, location_id: str, language: str = "en") -> List[Dict[str, Any]]:
@@ -345,26 +355,22 @@ async def analyze_reviews_sentiment_without_storage(
             }
         }
     
-    # Analyze sentiment for each review
+    # Analyze sentiment for all reviews with text at once, off the event loop
+    reviews = [review for review in reviews if review.get("text")]
+    sentiment_scores = await asyncio.to_thread(
+        analyze_sentiment_batch, [review["text"] for review in reviews]
+    )
+    
     analyzed_reviews = []
-    sentiment_scores = []
     ratings = []
     source_counts = {}
     
-    for review in reviews:
-        text = review.get("text", "")
-        if not text:
-            continue
-        
-        # Analyze sentiment
-        sentiment_score = analyze_sentiment(text)
-        
+    for review, sentiment_score in zip(reviews, sentiment_scores):
         # Add sentiment to review
         review_with_sentiment = review.copy()
         review_with_sentiment["sentiment_score"] = sentiment_score
         
         analyzed_reviews.append(review_with_sentiment)
-        sentiment_scores.append(sentiment_score)
         
         # Collect rating if available
         rating = review.get("rating")
@@ -376,8 +382,10 @@ async def analyze_reviews_sentiment_without_storage(
         source_counts[source] = source_counts.get(source, 0) + 1
     
     # Calculate statistics
-    avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else None
-    avg_rating = sum(ratings) / len(ratings) if ratings else None
+    scores = np.asarray(sentiment_scores, dtype=np.float64)
+    rating_values = np.asarray(ratings, dtype=np.float64)
+    avg_sentiment = float(scores.mean()) if scores.size else None
+    avg_rating = float(rating_values.mean()) if rating_values.size else None
     
     statistics = {
         "total_reviews": len(analyzed_reviews),
@@ -385,8 +393,8 @@ async def analyze_reviews_sentiment_without_storage(
         "average_rating": round(avg_rating, 2) if avg_rating else None,
         "sources": source_counts,
         "sentiment_range": {
-            "min": round(min(sentiment_scores), 2) if sentiment_scores else None,
-            "max": round(max(sentiment_scores), 2) if sentiment_scores else None
+            "min": round(float(scores.min()), 2) if scores.size else None,
+            "max": round(float(scores.max()), 2) if scores.size else None
         }
     }
     
@@ -1,6 +1,7 @@
 import sys
 sys.path.append("/home/dhruv/workspace/izh")
 import aiohttp
+import orjson
 from app.config.settings import settings
 import asyncio
 
@@ -17,8 +18,18 @@ GOOGLE_SEARCH_QUERIES = [
     # "museums",
 ]
 
+# Cap on concurrent place details requests, to stay within the API's QPS
+DETAILS_CONCURRENCY = 20
+
+# Only the place details fields fetch_details() keeps
+DETAILS_FIELDS = (
+    "place_id,name,geometry/location,rating,formatted_address,"
+    "opening_hours/weekday_text,types,photos,user_ratings_total,reviews"
+)
+
 async def fetch_google_places(session, destination, lat, lng, radius=8000):
-    all_results = []
+    # Queries overlap, so keep each place_id once (in first-seen order)
+    place_ids = {}
 
     for query in GOOGLE_SEARCH_QUERIES:
         params = {
@@ -29,26 +40,30 @@ async def fetch_google_places(session, destination, lat, lng, radius=8000):
         }
         url = f"{BASE}/textsearch/json"
         async with session.get(url, params=params) as resp:
-            data = await resp.json()
-            results = data.get("results", [])
-            all_results.extend(results)
+            data = orjson.loads(await resp.read())
+            for r in data.get("results", []):
+                place_ids.setdefault(r["place_id"], None)
+
+    # Enrich each with place details, fetched concurrently
+    sem = asyncio.Semaphore(DETAILS_CONCURRENCY)
 
-    # Enrich each with place details
-    enriched = []
-    for r in all_results:
-        details = await fetch_details(session, r["place_id"])
-        print(details)
-        if details:
-            enriched.append(details)
+    async def bounded_fetch(place_id):
+        async with sem:
+            return await fetch_details(session, place_id)
 
-    return enriched
+    details = await asyncio.gather(*(bounded_fetch(place_id) for place_id in place_ids))
+    return [d for d in details if d]
 
 async def fetch_details(session, place_id):
     url = f"{BASE}/details/json"
-    params = {"place_id": place_id, "key": settings.GOOGLE_PLACES_API_KEY}
+    params = {
+        "place_id": place_id,
+        "fields": DETAILS_FIELDS,
+        "key": settings.GOOGLE_PLACES_API_KEY
+    }
 
     async with session.get(url, params=params) as resp:
-        data = await resp.json()
+        data = orjson.loads(await resp.read())
         
         r = data.get("result")
         if not r:
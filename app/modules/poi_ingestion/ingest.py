@@ -18,6 +18,30 @@ logger = logging.getLogger(__name__)
 # Grid size in degrees (approximately 1km = 0.009 degrees)
 DEFAULT_GRID_SIZE = 0.009  # ~1km grid
 SEARCH_RADIUS_METERS = 1000  # 1km radius for searchNearby
+NEARBY_CONCURRENCY = 10  # max in-flight searchNearby requests
+
+# Connection pool shared by all API calls of an ingestion run
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 20
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds
+
+
+def create_ingestion_session() -> aiohttp.ClientSession:
+    """
+    Create an HTTP session whose keep-alive connections and DNS cache can be
+    shared across destinations.
+    
+    Returns:
+        aiohttp ClientSession; the caller is responsible for closing it
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 
 async def fetch_city_boundaries(session: aiohttp.ClientSession, city_name: str) -> Optional[Dict]:
@@ -220,7 +244,13 @@ async def fetch_pois_search_nearby(session: aiohttp.ClientSession, lat: float, l
         return []
 
 
-async def ingest_destination(city_name: str, ingestion_date=None, grid_size: float = DEFAULT_GRID_SIZE):
+async def ingest_destination(
+    city_name: str,
+    ingestion_date=None,
+    grid_size: float = DEFAULT_GRID_SIZE,
+    *,
+    session: Optional[aiohttp.ClientSession] = None
+):
     """
     Ingest POIs for a city using grid-based approach and store in PostgreSQL with distance-based clustering.
     
@@ -228,13 +258,18 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
         city_name: City name (e.g., "Amritsar")
         ingestion_date: Date of ingestion (defaults to today). Used for monthly tracking.
         grid_size: Grid step size in degrees (default ~1km)
+        session: Shared HTTP session (a new one is created and closed if not provided)
     """
     if ingestion_date is None:
         ingestion_date = date.today()
     
     logger.info(f"Starting ingestion for city: {city_name} on {ingestion_date}")
     
-    async with aiohttp.ClientSession() as session:
+    owns_session = session is None
+    if owns_session:
+        session = create_ingestion_session()
+    
+    try:
         # Step 1: Fetch city boundaries
         print(f"\n📍 Fetching city boundaries for {city_name}...")
         city_data = await fetch_city_boundaries(session, city_name)
@@ -265,28 +300,30 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
         all_raw_pois = []
         seen_poi_ids = set()  # Deduplicate by source_id
         
-        # Process grid points in batches to avoid overwhelming the API
-        batch_size = 10
-        for i in range(0, len(grid_points), batch_size):
-            batch = grid_points[i:i + batch_size]
-            tasks = [fetch_pois_search_nearby(session, lat, lng) for lat, lng in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error in batch: {result}")
-                    continue
-                
-                for poi in result:
-                    # Deduplicate by source_id
-                    poi_id = poi.get("id")
-                    if poi_id and poi_id not in seen_poi_ids:
-                        seen_poi_ids.add(poi_id)
-                        all_raw_pois.append(poi)
+        # Keep a bounded number of requests in flight across all grid points,
+        # rather than waiting for the slowest request of each fixed batch
+        sem = asyncio.Semaphore(NEARBY_CONCURRENCY)
+        
+        async def bounded_fetch(lat: float, lng: float) -> List[Dict]:
+            async with sem:
+                return await fetch_pois_search_nearby(session, lat, lng)
+        
+        results = await asyncio.gather(
+            *(bounded_fetch(lat, lng) for lat, lng in grid_points),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching grid point: {result}")
+                continue
             
-            # Small delay to respect rate limits
-            if i + batch_size < len(grid_points):
-                await asyncio.sleep(0.1)
+            for poi in result:
+                # Deduplicate by source_id
+                poi_id = poi.get("id")
+                if poi_id and poi_id not in seen_poi_ids:
+                    seen_poi_ids.add(poi_id)
+                    all_raw_pois.append(poi)
         
         print(f"📦 Total unique POIs fetched: {len(all_raw_pois)}")
         
@@ -330,6 +367,22 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
         updated_count = 0
         
         async with query_executor.transaction() as conn:
+            # Look up which POIs already exist with one query per source,
+            # rather than one query per POI
+            source_ids_by_source = {}
+            for norm_data in normalized:
+                poi_data = norm_data["poi"]
+                source_ids_by_source.setdefault(poi_data["source"], []).append(poi_data["source_id"])
+            
+            existing_pois = set()
+            for source, source_ids in source_ids_by_source.items():
+                rows = await conn.fetch(
+                    "SELECT source_id FROM pois WHERE source = $1 AND source_id = ANY($2::text[])",
+                    source,
+                    source_ids
+                )
+                existing_pois.update((source, row["source_id"]) for row in rows)
+            
             for norm_data in normalized:
                 poi_data = norm_data["poi"]
                 details_data = norm_data["details"]
@@ -338,17 +391,8 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
                 cluster_id = poi_to_cluster.get(poi_data["poi_uuid"], None)
                 
                 # Check if POI already exists
-                existing_poi_query = """
-                    SELECT id FROM pois 
-                    WHERE source = $1 AND source_id = $2
-                """
-                existing_poi = await conn.fetchrow(
-                    existing_poi_query,
-                    poi_data["source"],
-                    poi_data["source_id"]
-                )
-                
-                is_new = existing_poi is None
+                poi_key = (poi_data["source"], poi_data["source_id"])
+                is_new = poi_key not in existing_pois
                 
                 # Insert or update into pois table
                 poi_insert_query = """
@@ -394,6 +438,7 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
                     
                     if poi_id:
                         if is_new:
+                            existing_pois.add(poi_key)
                             inserted_count += 1
                         else:
                             updated_count += 1
@@ -435,6 +480,9 @@ async def ingest_destination(city_name: str, ingestion_date=None, grid_size: flo
             f"Total clusters: {len(clusters)}, "
             f"City ID: {city_id}"
         )
+    finally:
+        if owns_session:
+            await session.close()
 
 
 async def get_or_create_city(city_name: str, lat: float, lng: float, formatted_address: str) -> int:
@@ -464,9 +512,13 @@ async def main():
     logger.info(f"Starting monthly ingestion process on {ingestion_date}")
     logger.info(f"Processing {len(cities)} city/cities")
 
-    # Process all cities concurrently
-    coros = [ingest_destination(city_name, ingestion_date) for city_name in cities]
-    await asyncio.gather(*coros)
+    # Process all cities concurrently over one connection pool
+    async with create_ingestion_session() as session:
+        coros = [
+            ingest_destination(city_name, ingestion_date, session=session)
+            for city_name in cities
+        ]
+        await asyncio.gather(*coros)
     
     logger.info("✅ Monthly ingestion process completed")
 
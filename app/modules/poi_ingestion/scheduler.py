@@ -14,7 +14,7 @@ from datetime import date
 from typing import List, Tuple
 
 from app.config.database import db_config
-from app.modules.poi_ingestion.ingest import ingest_destination
+from app.modules.poi_ingestion.ingest import create_ingestion_session, ingest_destination
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +24,9 @@ async def run_monthly_ingestion(destinations: List[Tuple[str, float, float]]):
     Run monthly ingestion for all specified destinations.
     
     Args:
-        destinations: List of tuples (name, lat, lng) for each destination
+        destinations: List of tuples (name, lat, lng) for each destination.
+            ingest_destination locates each city itself, so lat/lng are
+            not passed on.
     """
     ingestion_date = date.today()
     logger.info(f"Starting monthly POI ingestion on {ingestion_date}")
@@ -35,12 +37,13 @@ async def run_monthly_ingestion(destinations: List[Tuple[str, float, float]]):
         await db_config.connect()
     
     try:
-        # Process all destinations concurrently
-        coros = [
-            ingest_destination(name, lat, lng, ingestion_date) 
-            for name, lat, lng in destinations
-        ]
-        await asyncio.gather(*coros)
+        # Process all destinations concurrently over one connection pool
+        async with create_ingestion_session() as session:
+            coros = [
+                ingest_destination(name, ingestion_date=ingestion_date, session=session)
+                for name, _lat, _lng in destinations
+            ]
+            await asyncio.gather(*coros)
         
         logger.info("✅ Monthly ingestion process completed successfully")
     except Exception as e:
@@ -2,13 +2,25 @@ import sys
 sys.path.append("/home/dhruv/workspace/izh")
 import logging
 from typing import Optional, Dict, Any, List
-from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
 import asyncio
+import threading
+import xxhash
 
 from app.helpers.db_executor import query_executor
 
 logger = logging.getLogger(__name__)
 
+# Same analyzer TextBlob uses by default; calling it directly skips building
+# a TextBlob per text
+_analyzer = PatternAnalyzer()
+
+# Scores keyed by xxh3 hash of the review text; reviews repeat across
+# sources and re-runs. Batches run in worker threads, hence the lock
+_SENTIMENT_CACHE_SIZE = 100_000
+_sentiment_cache: Dict[int, float] = {}
+_sentiment_cache_lock = threading.Lock()
+
 
 def analyze_sentiment(text: str) -> float:
     """
@@ -25,8 +37,7 @@ def analyze_sentiment(text: str) -> float:
     
     try:
         # TextBlob returns polarity between -1 (negative) and 1 (positive)
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
+        polarity = _analyzer.analyze(text).polarity
         
         # Convert from [-1, 1] to [0, 10] scale
         # polarity -1 -> 0, polarity 0 -> 5, polarity 1 -> 10
@@ -40,6 +51,42 @@ def analyze_sentiment(text: str) -> float:
         return 5.0  # Return neutral score on error
 
 
+def analyze_sentiment_batch(texts: List[str]) -> List[float]:
+    """
+    Analyze sentiment for many review texts in one call.
+    
+    Texts seen before (in this or earlier batches) reuse their cached score.
+    
+    Args:
+        texts: Review texts to analyze
+        
+    Returns:
+        Sentiment scores (0.0-10.0), in the same order as texts
+    """
+    keys = [xxhash.xxh3_64_intdigest(text.encode("utf-8")) for text in texts]
+    
+    with _sentiment_cache_lock:
+        cached = {key: _sentiment_cache[key] for key in keys if key in _sentiment_cache}
+    
+    # Score each uncached text once, outside the lock
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in missing:
+            missing[key] = text
+    scored = {key: analyze_sentiment(text) for key, text in missing.items()}
+    
+    if scored:
+        with _sentiment_cache_lock:
+            for key, score in scored.items():
+                if len(_sentiment_cache) >= _SENTIMENT_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del _sentiment_cache[next(iter(_sentiment_cache))]
+                _sentiment_cache[key] = score
+        cached.update(scored)
+    
+    return [cached[key] for key in keys]
+
+
 async def update_review_sentiment(review_id: int, sentiment_score: float) -> bool:
     """
     Update a single review with its sentiment score.
@@ -64,6 +111,32 @@ async def update_review_sentiment(review_id: int, sentiment_score: float) -> boo
         return False
 
 
+async def update_review_sentiments(review_ids: List[int], sentiment_scores: List[float]) -> bool:
+    """
+    Update many reviews with their sentiment scores in one statement.
+    
+    Args:
+        review_ids: The IDs of the reviews
+        sentiment_scores: The sentiment scores (0-10), in the same order as review_ids
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        query = """
+            UPDATE poi_reviews
+            SET sentiment_score = v.score
+            FROM unnest($1::bigint[], $2::float8[]) AS v(id, score)
+            WHERE poi_reviews.id = v.id
+        """
+        # Scores lost on a crash are left NULL and picked up by the next run
+        await query_executor.execute_async_commit(query, review_ids, sentiment_scores)
+        return True
+    except Exception as e:
+        logger.error(f"Error updating sentiment for {len(review_ids)} reviews: {e}")
+        return False
+
+
 async def analyze_and_update_review(review_id: int, text: str) -> Optional[float]:
     """
     Analyze sentiment of a review and update the database.
@@ -83,6 +156,25 @@ async def analyze_and_update_review(review_id: int, text: str) -> Optional[float
     return None
 
 
+async def _analyze_and_update_batch(batch: List[Any]) -> int:
+    """
+    Analyze sentiment for a batch of review rows and store all scores at once.
+    
+    Args:
+        batch: Review rows with id and text
+        
+    Returns:
+        Number of reviews updated (0 if the batch update failed)
+    """
+    sentiment_scores = await asyncio.to_thread(
+        analyze_sentiment_batch, [review["text"] for review in batch]
+    )
+    success = await update_review_sentiments(
+        [review["id"] for review in batch], sentiment_scores
+    )
+    return len(batch) if success else 0
+
+
 async def analyze_reviews_by_poi_id(poi_id: int, batch_size: int = 50) -> Dict[str, Any]:
     """
     Analyze sentiment for all reviews of a specific POI that don't have sentiment scores yet.
@@ -120,21 +212,10 @@ async def analyze_reviews_by_poi_id(poi_id: int, batch_size: int = 50) -> Dict[s
         for i in range(0, len(reviews), batch_size):
             batch = reviews[i:i + batch_size]
             
-            # Process batch concurrently
-            tasks = [
-                analyze_and_update_review(review["id"], review["text"])
-                for review in batch
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing review: {result}")
-                    failed_count += 1
-                elif result is not None:
-                    analyzed_count += 1
-                else:
-                    failed_count += 1
+            # Score the batch and write it back with one UPDATE
+            updated = await _analyze_and_update_batch(batch)
+            analyzed_count += updated
+            failed_count += len(batch) - updated
         
         logger.info(
             f"Analyzed sentiment for POI ID {poi_id}: "
@@ -194,20 +275,10 @@ async def analyze_all_reviews(batch_size: int = 100) -> Dict[str, Any]:
         for i in range(0, len(reviews), batch_size):
             batch = reviews[i:i + batch_size]
             
-            # Process batch concurrently
-            tasks = [
-                analyze_and_update_review(review["id"], review["text"])
-                for review in batch
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    failed_count += 1
-                elif result is not None:
-                    analyzed_count += 1
-                else:
-                    failed_count += 1
+            # Score the batch and write it back with one UPDATE
+            updated = await _analyze_and_update_batch(batch)
+            analyzed_count += updated
+            failed_count += len(batch) - updated
             
             logger.info(
                 f"Progress: {min(i + batch_size, len(reviews))}/{len(reviews)} reviews processed"
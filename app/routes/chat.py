@@ -1,14 +1,12 @@
 from fastapi import APIRouter, HTTPException, Request, Query
 from typing import List, Optional
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.helpers.openai_helper import ChatRequest, ChatResponse, Message, openai_helper
 from app.helpers.cache_helper import cache_helper
 from app.config.settings import settings
+from app.config.rate_limit import limiter
 
 router = APIRouter(prefix="/chat", tags=["chat"])
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.post("/completion", response_model=ChatResponse)
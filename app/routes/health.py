@@ -1,15 +1,13 @@
 from fastapi import APIRouter, Request
 import requests
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from app.config.database import db_config
 from app.config.redis_config import redis_config
 from app.config.settings import settings
+from app.config.rate_limit import limiter
 import asyncio
 import httpx
 
 router = APIRouter(prefix="/health", tags=["health"])
-limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get("")
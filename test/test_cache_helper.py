@@ -1,8 +1,10 @@
 import pytest
 import json
+import orjson
 from unittest.mock import patch, AsyncMock, MagicMock
 
 from app.helpers.cache_helper import CacheHelper
+from app.helpers.db_executor import _RecordView
 
 
 @pytest.fixture
@@ -61,7 +63,22 @@ async def test_cache_set_success(cache_helper, mock_redis_client):
     mock_redis_client.setex.assert_called_once_with(
         "test_key",
         600,
-        json.dumps(test_value)
+        orjson.dumps(test_value)
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_set_mapping_view(cache_helper, mock_redis_client):
+    """Test cache set serializes read-only row views as objects."""
+    test_value = [_RecordView({"id": 1, "name": "Goa"})]
+    
+    result = await cache_helper.set("test_key", test_value, ttl=600)
+    
+    assert result is True
+    mock_redis_client.setex.assert_called_once_with(
+        "test_key",
+        600,
+        orjson.dumps([{"id": 1, "name": "Goa"}])
     )
 
 
@@ -88,6 +105,36 @@ async def test_cache_set_error(cache_helper, mock_redis_client):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_cache_get_many(cache_helper, mock_redis_client):
+    """Test cache get many returns values in key order."""
+    mock_redis_client.mget = AsyncMock(
+        return_value=[orjson.dumps({"key": "value"}), None]
+    )
+    
+    result = await cache_helper.get_many(["hit_key", "miss_key"])
+    
+    assert result == [{"key": "value"}, None]
+    mock_redis_client.mget.assert_called_once_with(["hit_key", "miss_key"])
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many(cache_helper, mock_redis_client):
+    """Test cache set many pipelines one SETEX per key."""
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=[True, True])
+    mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+    mock_pipe.__aexit__ = AsyncMock(return_value=None)
+    mock_redis_client.pipeline = MagicMock(return_value=mock_pipe)
+    
+    result = await cache_helper.set_many({"a": 1, "b": 2}, ttl=60)
+    
+    assert result is True
+    mock_pipe.setex.assert_any_call("a", 60, orjson.dumps(1))
+    mock_pipe.setex.assert_any_call("b", 60, orjson.dumps(2))
+    mock_pipe.execute.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_cache_delete_success(cache_helper, mock_redis_client):
     """Test cache delete."""
@@ -109,6 +156,23 @@ async def test_cache_delete_error(cache_helper, mock_redis_client):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_cache_delete_pattern(cache_helper, mock_redis_client):
+    """Test delete pattern unlinks every SCAN batch."""
+    mock_redis_client.scan = AsyncMock(side_effect=[
+        (42, [b"user:1", b"user:2"]),
+        (0, [b"user:3"]),
+    ])
+    mock_redis_client.unlink = AsyncMock(side_effect=[2, 1])
+    
+    result = await cache_helper.delete_pattern("user:*")
+    
+    assert result == 3
+    assert mock_redis_client.scan.call_count == 2
+    mock_redis_client.unlink.assert_any_call(b"user:1", b"user:2")
+    mock_redis_client.unlink.assert_any_call(b"user:3")
+
+
 @pytest.mark.asyncio
 async def test_cache_exists_true(cache_helper, mock_redis_client):
     """Test cache exists check when key exists."""
@@ -130,6 +194,48 @@ async def test_cache_exists_false(cache_helper, mock_redis_client):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_rate_limit_incr(cache_helper, mock_redis_client):
+    """Test rate limit increment runs the counter script once."""
+    mock_script = AsyncMock(return_value=3)
+    mock_redis_client.register_script = MagicMock(return_value=mock_script)
+    
+    result = await cache_helper.rate_limit_incr("rate:client", 60)
+    
+    assert result == 3
+    mock_script.assert_called_once_with(
+        keys=["rate:client"],
+        args=[60],
+        client=mock_redis_client
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_set_with_lock(cache_helper, mock_redis_client):
+    """Test set with lock runs the atomic lock script."""
+    mock_script = AsyncMock(return_value=1)
+    mock_redis_client.register_script = MagicMock(return_value=mock_script)
+    
+    result = await cache_helper.set_with_lock("test_key", {"key": "value"}, ttl=600)
+    
+    assert result is True
+    call_kwargs = mock_script.call_args.kwargs
+    assert call_kwargs["keys"] == ["lock:test_key", "test_key"]
+    assert call_kwargs["args"][2:] == [600, orjson.dumps({"key": "value"})]
+    # The lock is left to expire rather than deleted
+    assert "DEL" not in mock_redis_client.register_script.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_cache_set_with_lock_held(cache_helper, mock_redis_client):
+    """Test set with lock is refused while an earlier write's lock is unexpired."""
+    mock_redis_client.register_script = MagicMock(return_value=AsyncMock(return_value=0))
+    
+    result = await cache_helper.set_with_lock("test_key", {"key": "value"})
+    
+    assert result is False
+
+
 @pytest.mark.asyncio
 async def test_cache_disabled(mock_settings, mock_redis_config):
     """Test cache operations when cache is disabled."""
@@ -160,6 +266,11 @@ async def test_cache_key_generation(cache_helper):
     # Different inputs should generate different keys
     key3 = cache_helper.cache_key("arg1", "arg3", kwarg1="val1")
     assert key != key3
+    
+    # Argument types are part of the key, and large ints are accepted
+    assert cache_helper.cache_key((1, 2)) != cache_helper.cache_key([1, 2])
+    assert cache_helper.cache_key({1: "a"}) != cache_helper.cache_key({"1": "a"})
+    assert cache_helper.cache_key(1 << 100)
 
 
 @pytest.mark.asyncio
@@ -171,6 +282,10 @@ async def test_cache_decorator(mock_redis_client, mock_settings, mock_redis_conf
     
     with patch("app.helpers.cache_helper.redis_config", mock_redis_config), \
          patch("app.helpers.cache_helper.settings", mock_settings):
+        helper = CacheHelper()
+    
+    # The decorator uses the module-level helper
+    with patch("app.helpers.cache_helper.cache_helper", helper):
         from app.helpers.cache_helper import cached
         
         call_count = 0
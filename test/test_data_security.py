@@ -1,6 +1,8 @@
 """
 Tests for data security helper.
 """
+import hashlib
+
 import pytest
 from app.helpers.data_security import DataSecurityHelper, MaskedData
 
@@ -88,6 +90,21 @@ class TestDataMasking:
         
         assert "john.doe@example.com" in unmasked
     
+    def test_unmask_multiple_tokens(self, security_helper):
+        """Test unmasking restores every masked value."""
+        original_text = "Contact john@example.com or jane@example.com from 10.0.0.1"
+        masked_result = security_helper.mask_sensitive_data(
+            original_text,
+            preserve_format=False
+        )
+        
+        unmasked = security_helper.unmask_data(
+            masked_result.masked_text,
+            masked_result.token_map
+        )
+        
+        assert unmasked == original_text
+    
     def test_no_masking_when_disabled(self):
         """Test that masking is skipped when disabled."""
         helper = DataSecurityHelper()
@@ -109,6 +126,16 @@ class TestDataMasking:
         assert "555-1234" in result.masked_text  # Phone not masked
         assert "192.168.1.1" in result.masked_text  # IP not masked
         assert result.patterns_found == ['email']
+    
+    def test_repeated_pattern_names(self, security_helper):
+        """Test repeated pattern names are treated as one."""
+        text = "Email: john@example.com, IP: 192.168.1.1"
+        result = security_helper.mask_sensitive_data(
+            text, patterns=['email', 'ip_address', 'email']
+        )
+        
+        assert "john@example.com" not in result.masked_text
+        assert "192.168.1.1" not in result.masked_text
 
 
 class TestEncryption:
@@ -150,6 +177,15 @@ class TestHashing:
         hash_result2 = security_helper.hash_pii(text, algorithm='sha256')
         assert hash_result == hash_result2
     
+    def test_hash_pii_default_blake2b(self, security_helper):
+        """Test default BLAKE2b hashing."""
+        text = "john.doe@example.com"
+        hash_result = security_helper.hash_pii(text)
+        
+        assert len(hash_result) == 32  # 16-byte BLAKE2b digest
+        assert hash_result == security_helper.hash_pii(text, algorithm='blake2b')
+        assert hash_result == hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    
     def test_hash_pii_md5(self, security_helper):
         """Test MD5 hashing."""
         text = "sensitive@data.com"
@@ -207,6 +243,33 @@ class TestRedaction:
         # Email should be masked in the message
         assert "john@example.com" not in redacted["message"]
         assert redacted["note"] == "Just a regular note"
+    
+    def test_redact_pii_across_values(self, security_helper):
+        """Test PII is masked in every value of a nested payload."""
+        data = {
+            "from": "john@example.com",
+            "body": "No PII here",
+            "meta": {
+                "ip": "Server IP: 192.168.1.100",
+                "count": 3
+            }
+        }
+        
+        redacted = security_helper.redact_for_logging(data)
+        
+        assert redacted["from"].startswith("[EMAIL_")
+        assert redacted["body"] == "No PII here"
+        assert redacted["meta"]["ip"].startswith("Server IP: [IP_ADDRESS_")
+        assert redacted["meta"]["count"] == 3
+
+
+class TestPIIDetection:
+    """Test PII detection."""
+    
+    def test_has_pii(self, security_helper):
+        """Test detection of PII in text."""
+        assert security_helper.has_pii("Contact me at john@example.com")
+        assert not security_helper.has_pii("Just a regular note")
 
 
 class TestSanitization:
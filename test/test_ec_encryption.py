@@ -0,0 +1,54 @@
+"""
+Tests for X25519 hybrid encryption helper.
+"""
+import base64
+
+import pytest
+
+from app.helpers.ec_encryption import ECEncryptionHelper, get_encryption_helper
+
+
+@pytest.fixture
+def ec_helper():
+    """Create an ECEncryptionHelper with a freshly generated key pair."""
+    return ECEncryptionHelper()
+
+
+class TestX25519Encryption:
+    """Test AES-GCM + X25519 hybrid encryption."""
+    
+    def test_encrypt_decrypt(self, ec_helper):
+        """Test round-trip of a string payload."""
+        original = "Sensitive itinerary details"
+        encrypted = ec_helper.encrypt(original)
+        
+        assert original not in encrypted
+        assert ec_helper.decrypt(encrypted).decode('utf-8') == original
+    
+    def test_encrypt_api_response(self, ec_helper):
+        """Test round-trip of an API response dictionary."""
+        response = {"destination": "Goa", "days": 3}
+        encrypted = ec_helper.encrypt_api_response(response)
+        
+        assert encrypted["encrypted"] is True
+        assert ec_helper.decrypt_api_response(encrypted) == response
+    
+    def test_wrong_key_rejected(self, ec_helper):
+        """Test decryption with another recipient's key fails."""
+        encrypted = ec_helper.encrypt("secret")
+        
+        with pytest.raises(ValueError):
+            ECEncryptionHelper().decrypt(encrypted)
+    
+    def test_tampered_ciphertext_rejected(self, ec_helper):
+        """Test GCM authentication rejects modified ciphertext."""
+        envelope = bytearray(base64.b64decode(ec_helper.encrypt("secret")))
+        envelope[-1] ^= 1
+        
+        with pytest.raises(ValueError):
+            ec_helper.decrypt(base64.b64encode(bytes(envelope)).decode('ascii'))
+    
+    def test_unknown_scheme(self):
+        """Test unknown schemes are rejected."""
+        with pytest.raises(ValueError):
+            get_encryption_helper("dsa")
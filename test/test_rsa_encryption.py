@@ -0,0 +1,160 @@
+"""
+Tests for RSA hybrid encryption helper.
+"""
+import base64
+import json
+import os
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from app.helpers.rsa_encryption import RSAEncryptionHelper
+
+
+def _legacy_cbc_payload(rsa_helper, padded: bytes) -> str:
+    """Build a pre-GCM JSON payload: AES-CBC over already padded plaintext."""
+    aes_key = os.urandom(32)
+    iv = os.urandom(16)
+    encryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).encryptor()
+    ciphertext = encryptor.update(padded) + encryptor.finalize()
+    encrypted_key = rsa_helper.public_key.encrypt(
+        aes_key,
+        padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+    )
+    return json.dumps({
+        "encrypted_key": base64.b64encode(encrypted_key).decode('utf-8'),
+        "encrypted_data": base64.b64encode(ciphertext).decode('utf-8'),
+        "iv": base64.b64encode(iv).decode('utf-8')
+    })
+
+
+@pytest.fixture(scope="module")
+def rsa_helper():
+    """Create an RSAEncryptionHelper with a freshly generated key pair."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return RSAEncryptionHelper(private_key=private_key)
+
+
+class TestHybridEncryption:
+    """Test AES + RSA hybrid encryption."""
+    
+    def test_encrypt_decrypt_string(self, rsa_helper):
+        """Test round-trip of a string payload."""
+        original = "Sensitive itinerary details"
+        encrypted = rsa_helper.encrypt(original)
+        
+        assert original not in encrypted
+        assert rsa_helper.decrypt_string(encrypted) == original
+    
+    def test_encrypt_decrypt_block_aligned(self, rsa_helper):
+        """Test round-trip of a payload that is a multiple of the block size."""
+        original = b"x" * 32
+        encrypted = rsa_helper.encrypt(original)
+        
+        assert rsa_helper.decrypt(encrypted) == original
+    
+    def test_encrypt_decrypt_large_payload(self, rsa_helper):
+        """Test round-trip of payloads spanning several stream chunks."""
+        response = {"reviews": ["Great place to visit ☀"] * 10000}
+        assert rsa_helper.decrypt_json(rsa_helper.encrypt(response)) == response
+        
+        original = "é" * 100000
+        assert rsa_helper.decrypt_string(rsa_helper.encrypt(original)) == original
+    
+    def test_encrypt_api_response(self, rsa_helper):
+        """Test round-trip of an API response dictionary."""
+        response = {"destination": "Goa", "days": 3}
+        encrypted = rsa_helper.encrypt_api_response(response)
+        
+        assert encrypted["encrypted"] is True
+        assert rsa_helper.decrypt_api_response(encrypted) == response
+    
+    def test_tampered_ciphertext_rejected(self, rsa_helper):
+        """Test GCM authentication rejects modified ciphertext."""
+        envelope = bytearray(base64.b64decode(rsa_helper.encrypt("Sensitive itinerary details")))
+        envelope[-1] ^= 1
+        
+        with pytest.raises(ValueError):
+            rsa_helper.decrypt(base64.b64encode(bytes(envelope)).decode('ascii'))
+    
+    def test_truncated_envelope_rejected(self, rsa_helper):
+        """Test a truncated envelope raises ValueError."""
+        envelope = base64.b64decode(rsa_helper.encrypt("Sensitive itinerary details"))
+        
+        with pytest.raises(ValueError):
+            rsa_helper.decrypt(base64.b64encode(envelope[:100]).decode('ascii'))
+    
+    def test_decrypt_legacy_cbc_payload(self, rsa_helper):
+        """Test payloads encrypted with AES-CBC (no tag) still decrypt."""
+        original = b"Legacy payload"
+        pad_length = 16 - (len(original) % 16)
+        payload = _legacy_cbc_payload(rsa_helper, original + bytes([pad_length] * pad_length))
+        
+        assert rsa_helper.decrypt(payload) == original
+    
+    def test_legacy_cbc_bad_padding_rejected(self, rsa_helper):
+        """Test AES-CBC payloads with malformed PKCS#7 padding are rejected."""
+        for padded in (b"Legacy payload\x01\x02", b"Legacy payload\x00\x00", b"x" * 15 + b"\x11"):
+            with pytest.raises(ValueError):
+                rsa_helper.decrypt(_legacy_cbc_payload(rsa_helper, padded))
+    
+    def test_encrypt_api_response_cache(self, rsa_helper):
+        """Test cache_ok reuses the envelope for identical responses only."""
+        response = {"status": "healthy"}
+        first = rsa_helper.encrypt_api_response(response, cache_ok=True)
+        second = rsa_helper.encrypt_api_response(dict(response), cache_ok=True)
+        other = rsa_helper.encrypt_api_response({"status": "degraded"}, cache_ok=True)
+        
+        assert first["data"] == second["data"]
+        assert other["data"] != first["data"]
+        assert rsa_helper.decrypt_api_response(second) == response
+        assert rsa_helper.encrypt_api_response(response)["data"] != first["data"]
+    
+    @pytest.mark.asyncio
+    async def test_async_api_response_round_trip(self, rsa_helper):
+        """Test the executor-backed API response wrappers round-trip."""
+        response = {"destination": "Goa", "days": 3}
+        encrypted = await rsa_helper.encrypt_api_response_async(response)
+        
+        assert encrypted["encrypted"] is True
+        assert await rsa_helper.decrypt_api_response_async(encrypted) == response
+    
+    def test_session_reuse(self, rsa_helper):
+        """Test reused session keys skip the wrapped key after the first message."""
+        first = rsa_helper.encrypt("first", reuse_session=True)
+        second = rsa_helper.encrypt("second", reuse_session=True)
+        
+        assert len(base64.b64decode(second)) < len(base64.b64decode(first))
+        assert rsa_helper.decrypt_string(first) == "first"
+        assert rsa_helper.decrypt_string(second) == "second"
+    
+    def test_unknown_session_rejected(self, rsa_helper):
+        """Test a session envelope can't be read without its first message."""
+        receiver = RSAEncryptionHelper(private_key=rsa_helper.private_key)
+        rsa_helper.encrypt("first", reuse_session=True)
+        second = rsa_helper.encrypt("second", reuse_session=True)
+        
+        with pytest.raises(ValueError):
+            receiver.decrypt(second)
+    
+    def test_session_survives_ordinary_traffic(self, rsa_helper):
+        """Test ordinary envelopes don't evict a live receive session."""
+        first = rsa_helper.encrypt("first", reuse_session=True)
+        assert rsa_helper.decrypt_string(first) == "first"
+        
+        for i in range(1030):
+            assert rsa_helper.decrypt_string(rsa_helper.encrypt(f"plain {i}")) == f"plain {i}"
+        
+        second = rsa_helper.encrypt("second", reuse_session=True)
+        assert rsa_helper.decrypt_string(second) == "second"
+    
+    def test_decrypt_invalid_data(self, rsa_helper):
+        """Test decryption of malformed input raises ValueError."""
+        with pytest.raises(ValueError):
+            rsa_helper.decrypt("not json")